@@ -6,9 +6,14 @@ This script shows how to use the Rust implementation from Python code,
 providing a drop-in replacement for the original Python implementation.
 """
 
+import os
 import sys
 import time
+import wave
+import asyncio
+import functools
 from pathlib import Path
+from typing import Optional
 
 try:
     import bjj_analyzer_rust
@@ -18,12 +23,62 @@ except ImportError as e:
     print("Build the Python bindings with: cargo build --release --features python-bindings")
     sys.exit(1)
 
+try:
+    import av
+    import numpy as np
+    PYAV_AVAILABLE = True
+except ImportError:
+    PYAV_AVAILABLE = False
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Whisper expects 16 kHz mono 16-bit PCM
+AUDIO_SAMPLE_RATE = 16000
+
+VIDEO_EXTENSIONS = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm'}
+
+# Upload formats for the remote Whisper server: (suffix, FFmpeg codec arguments, content type)
+# Opus at 24 kbps is transparent for speech; FLAC is the lossless option
+AUDIO_COMPRESSION = {
+    'opus': ('.ogg', ['-c:a', 'libopus', '-b:a', '24k'], 'audio/ogg'),
+    'flac': ('.flac', ['-c:a', 'flac'], 'audio/flac'),
+    'wav': ('.wav', ['-c:a', 'pcm_s16le'], 'audio/wav'),
+}
+
+@functools.lru_cache(maxsize=1)
+def _cached_system_requirements() -> dict:
+    """Probe FFmpeg/FFprobe once per process; the probe spawns a subprocess per tool"""
+    return bjj_analyzer_rust.check_system_requirements()
+
+def get_system_requirements() -> dict:
+    """Return cached system requirements (set BJJ_FORCE_REPROBE=1 to probe again)"""
+    if os.getenv("BJJ_FORCE_REPROBE") == "1":
+        _cached_system_requirements.cache_clear()
+    return _cached_system_requirements()
+
 def example_system_check():
     """Check system requirements and capabilities"""
     print("\n🔧 System Requirements Check")
     print("-" * 40)
     
-    reqs = bjj_analyzer_rust.check_system_requirements()
+    reqs = get_system_requirements()
     
     print(f"FFmpeg available: {'✅' if reqs['ffmpeg_available'] else '❌'}")
     print(f"FFprobe available: {'✅' if reqs['ffprobe_available'] else '❌'}")
@@ -66,8 +121,55 @@ def example_video_info(video_path: str):
         print(f"❌ Error extracting video info: {e}")
         return None
 
-def example_audio_extraction(video_path: str, output_dir: str = "./output"):
-    """Extract audio from video using Rust implementation"""
+def decode_audio_pyav(video_path: str):
+    """Decode and resample the first audio stream in-process with PyAV.
+
+    Returns a mono int16 numpy array at AUDIO_SAMPLE_RATE without touching disk.
+    """
+    resampler = av.AudioResampler(format='s16', layout='mono', rate=AUDIO_SAMPLE_RATE)
+    
+    with av.open(video_path) as container:
+        stream = container.streams.audio[0]
+        
+        # Preallocate from the container's duration estimate, growing only if it was short
+        expected_samples = 0
+        if stream.duration is not None and stream.time_base is not None:
+            expected_samples = int(stream.duration * stream.time_base * AUDIO_SAMPLE_RATE)
+        buffer = np.empty(max(expected_samples, AUDIO_SAMPLE_RATE), dtype=np.int16)
+        offset = 0
+        
+        def append(frames):
+            nonlocal buffer, offset
+            for resampled in frames:
+                chunk = resampled.to_ndarray().reshape(-1)
+                end = offset + chunk.shape[0]
+                if end > buffer.shape[0]:
+                    buffer = np.resize(buffer, max(end, buffer.shape[0] * 2))
+                buffer[offset:end] = chunk
+                offset = end
+        
+        for frame in container.decode(stream):
+            append(resampler.resample(frame))
+        
+        # Flush samples buffered inside the resampler
+        append(resampler.resample(None))
+    
+    return buffer[:offset]
+
+def write_wav(samples, output_path: Path) -> Path:
+    """Write mono int16 PCM samples to a WAV file"""
+    with wave.open(str(output_path), 'wb') as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(AUDIO_SAMPLE_RATE)
+        wav_file.writeframes(samples.tobytes())
+    return output_path
+
+def example_audio_extraction(video_path: str, output_dir: Optional[str] = "./output"):
+    """Extract audio from video in-process with PyAV, falling back to the Rust implementation
+
+    Returns the decoded samples when no output_dir is given, otherwise the WAV path.
+    """
     print(f"\n🎵 Audio Extraction: {video_path}")
     print("-" * 40)
     
@@ -77,7 +179,24 @@ def example_audio_extraction(video_path: str, output_dir: str = "./output"):
     
     try:
         start_time = time.time()
-        audio_path = bjj_analyzer_rust.extract_audio_rust(video_path, output_dir)
+        
+        if PYAV_AVAILABLE:
+            samples = decode_audio_pyav(video_path)
+            duration = len(samples) / AUDIO_SAMPLE_RATE
+            
+            if output_dir is None:
+                processing_time = time.time() - start_time
+                print(f"✅ Decoded {duration:.1f}s of audio in-process (PyAV)")
+                print(f"Processing time: {processing_time:.3f} seconds")
+                return samples
+            
+            Path(output_dir).mkdir(parents=True, exist_ok=True)
+            audio_path = str(write_wav(samples, Path(output_dir) / f"{Path(video_path).stem}.wav"))
+        else:
+            if output_dir is None:
+                output_dir = "./output"
+            audio_path = bjj_analyzer_rust.extract_audio_rust(video_path, output_dir)
+        
         processing_time = time.time() - start_time
         
         print(f"✅ Audio extracted to: {audio_path}")
@@ -94,8 +213,153 @@ def example_audio_extraction(video_path: str, output_dir: str = "./output"):
         print(f"❌ Error extracting audio: {e}")
         return None
 
-def example_batch_processing(video_dir: str, output_dir: str = "./output"):
-    """Process multiple videos using Rust implementation"""
+async def extract_worker(video_queue: asyncio.Queue, audio_queue: asyncio.Queue, output_dir: Path,
+                         compression: str = 'opus'):
+    """Extract audio with FFmpeg for each queued video and hand it to the upload stage"""
+    suffix, codec_args, _ = AUDIO_COMPRESSION[compression]
+    
+    while True:
+        video_path = await video_queue.get()
+        if video_path is None:
+            return
+        
+        audio_path = output_dir / f"{video_path.stem}{suffix}"
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-loglevel", "error", "-i", str(video_path),
+            "-vn", "-ac", "1", "-ar", str(AUDIO_SAMPLE_RATE), *codec_args, str(audio_path),
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        _, stderr = await process.communicate()
+        
+        if process.returncode != 0:
+            print(f"❌ Audio extraction failed for {video_path.name}: {stderr.decode().strip()}")
+            await audio_queue.put((video_path, None))
+        else:
+            await audio_queue.put((video_path, audio_path))
+
+# Columns of the aggregated segments table written at the end of a batch
+SEGMENT_COLUMNS = ('video_id', 'seg_id', 'start', 'end', 'text', 'avg_logprob')
+
+def write_segments_parquet(columns: dict, output_path: Path) -> Optional[Path]:
+    """Write the segments of every video in a batch to a single Parquet file"""
+    if not PYARROW_AVAILABLE or not columns['video_id']:
+        return None
+    
+    schema = pa.schema([
+        ('video_id', pa.string()),
+        ('seg_id', pa.uint32()),
+        ('start', pa.float32()),
+        ('end', pa.float32()),
+        ('text', pa.string()),
+        ('avg_logprob', pa.float32()),
+    ])
+    table = pa.Table.from_pydict(columns, schema=schema)
+    parquet_path = output_path / "segments.parquet"
+    pq.write_table(table, parquet_path, compression="zstd")
+    return parquet_path
+
+async def transcribe_worker(client, server_url: str, audio_queue: asyncio.Queue, output_dir: Path, result: dict,
+                            compression: str = 'opus', columns: Optional[dict] = None):
+    """Upload extracted audio to the remote Whisper server and save the transcription"""
+    content_type = AUDIO_COMPRESSION[compression][2]
+    
+    while True:
+        item = await audio_queue.get()
+        if item is None:
+            return
+        
+        video_path, audio_path = item
+        if audio_path is None:
+            result['failed'] += 1
+            continue
+        
+        try:
+            with open(audio_path, 'rb') as audio_file:
+                response = await client.post(
+                    f"{server_url}/transcribe",
+                    files={"audio": (audio_path.name, audio_file, content_type)},
+                    data={"model": "base"}
+                )
+            response.raise_for_status()
+            
+            transcript_path = output_dir / f"{video_path.stem}.json"
+            transcript_path.write_text(response.text)
+            
+            if columns is not None:
+                for segment in response.json().get('segments', []):
+                    columns['video_id'].append(video_path.stem)
+                    columns['seg_id'].append(segment['id'])
+                    columns['start'].append(segment['start'])
+                    columns['end'].append(segment['end'])
+                    columns['text'].append(segment['text'])
+                    columns['avg_logprob'].append(segment.get('avg_logprob'))
+            print(f"  ✅ {video_path.name} -> {transcript_path}")
+            result['successful'] += 1
+        except Exception as e:
+            print(f"  ❌ Transcription failed for {video_path.name}: {e}")
+            result['failed'] += 1
+
+async def process_videos_pipelined(video_dir: str, output_dir: str, server_url: str,
+                                   extract_workers: int = 4, upload_workers: int = 2,
+                                   compression: str = 'opus') -> dict:
+    """Overlap FFmpeg extraction with uploads to the remote Whisper server
+    
+    Extractors feed a bounded queue that uploaders drain, so CPU-bound extraction
+    of the next videos runs while earlier ones are being transcribed on the GPU.
+    Audio is compressed before upload ('opus', lossless 'flac', or raw 'wav').
+    With pyarrow installed, all segments are also collected into segments.parquet.
+    """
+    if compression not in AUDIO_COMPRESSION:
+        raise ValueError(f"Unsupported compression: {compression}")
+    
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    
+    videos = sorted(p for p in Path(video_dir).rglob('*') if p.suffix.lower() in VIDEO_EXTENSIONS)
+    result = {'total': len(videos), 'successful': 0, 'failed': 0}
+    columns = {name: [] for name in SEGMENT_COLUMNS} if PYARROW_AVAILABLE else None
+    
+    video_queue = asyncio.Queue()
+    for video_path in videos:
+        video_queue.put_nowait(video_path)
+    for _ in range(extract_workers):
+        video_queue.put_nowait(None)
+    
+    # Bounded so extraction never runs far ahead of the uploads
+    audio_queue = asyncio.Queue(maxsize=2 * upload_workers)
+    
+    # One pooled client for the whole batch so uploads reuse kept-alive connections
+    # (multiplexed over HTTP/2 when h2 is installed and the server is reached over TLS)
+    limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    timeout = httpx.Timeout(60.0, read=None)
+    async with httpx.AsyncClient(http2=HTTP2_AVAILABLE, limits=limits, timeout=timeout) as client:
+        extractors = [
+            asyncio.create_task(extract_worker(video_queue, audio_queue, output_path, compression))
+            for _ in range(extract_workers)
+        ]
+        uploaders = [
+            asyncio.create_task(
+                transcribe_worker(client, server_url, audio_queue, output_path, result, compression, columns)
+            )
+            for _ in range(upload_workers)
+        ]
+        
+        await asyncio.gather(*extractors)
+        for _ in uploaders:
+            await audio_queue.put(None)
+        await asyncio.gather(*uploaders)
+    
+    if columns is not None:
+        parquet_path = write_segments_parquet(columns, output_path)
+        if parquet_path:
+            result['segments_path'] = str(parquet_path)
+    
+    return result
+
+def example_batch_processing(video_dir: str, output_dir: str = "./output", server_url: Optional[str] = None,
+                             compression: str = 'opus'):
+    """Process multiple videos using Rust implementation, or the pipelined remote driver when a server URL is given"""
     print(f"\n📦 Batch Processing: {video_dir}")
     print("-" * 40)
     
@@ -105,19 +369,25 @@ def example_batch_processing(video_dir: str, output_dir: str = "./output"):
     
     try:
         start_time = time.time()
-        result = bjj_analyzer_rust.process_videos_rust(
-            video_dir=video_dir,
-            output_dir=output_dir,
-            workers=4,
-            sample_rate=16000,
-            transcription_provider="local"
-        )
+        if server_url and HTTPX_AVAILABLE:
+            print(f"Using remote Whisper server: {server_url}")
+            result = asyncio.run(process_videos_pipelined(video_dir, output_dir, server_url, compression=compression))
+        else:
+            result = bjj_analyzer_rust.process_videos_rust(
+                video_dir=video_dir,
+                output_dir=output_dir,
+                workers=4,
+                sample_rate=16000,
+                transcription_provider="local"
+            )
         processing_time = time.time() - start_time
         
         print(f"✅ Batch processing completed!")
         print(f"Total videos: {result['total']}")
         print(f"Successful: {result['successful']}")
         print(f"Failed: {result['failed']}")
+        if result.get('segments_path'):
+            print(f"Segments table: {result['segments_path']}")
         print(f"Total processing time: {processing_time:.1f} seconds")
         
         if result['total'] > 0:
@@ -241,7 +511,7 @@ def main():
         print("Create test_data/sample.mp4 for full examples")
     
     # Example 2: Batch Processing
-    example_batch_processing(test_dir, output_dir)
+    example_batch_processing(test_dir, output_dir, os.getenv("WHISPER_SERVER_URL"))
     
     # Example 3: Advanced Processing
     example_advanced_processing()
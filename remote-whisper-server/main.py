@@ -5,17 +5,41 @@ Designed for Docker deployment with minimal dependencies
 """
 
 import os
+import gc
+import asyncio
 import tempfile
+import threading
 import time
 import logging
+from collections import OrderedDict
+from math import ceil
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, List, Any
 from pathlib import Path
 
+import numpy as np
 import uvicorn
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-import whisper
+from starlette.concurrency import run_in_threadpool
+from starlette.formparsers import MultiPartParser
+import diskcache
+from blake3 import blake3
+from faster_whisper import WhisperModel, BatchedInferencePipeline
+from faster_whisper.audio import decode_audio, pad_or_trim
+from faster_whisper.feature_extractor import FeatureExtractor
+from faster_whisper.tokenizer import Tokenizer
+from faster_whisper.transcribe import get_suppressed_tokens
+
+# torch is only needed for GPU detection, memory stats and GPU feature extraction;
+# faster-whisper itself runs on CTranslate2
+try:
+    import torch
+    _HAS_TORCH = True
+except ImportError:
+    torch = None
+    _HAS_TORCH = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,11 +49,58 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Remote Whisper GPU Server",
     description="High-performance Whisper transcription with GPU acceleration",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-# Global model cache
-_models: Dict[str, Any] = {}
+# Global model cache in LRU order (least recently used first)
+_models: "OrderedDict[str, Any]" = OrderedDict()
+_models_lock = threading.RLock()
+
+# Loads in progress, so concurrent requests for one model wait on a single download
+_model_loads: "Dict[str, Future]" = {}
+
+# Evict least recently used models once GPU memory in use exceeds this (0 = 90% of device memory)
+MAX_VRAM_BYTES = int(os.getenv("MAX_VRAM_BYTES", "0"))
+
+# Compute type each cached model was loaded with
+_model_compute_types: Dict[str, str] = {}
+
+# Converted CTranslate2 models are kept here (a persistent volume in docker-compose)
+MODELS_DIR = Path(os.getenv("MODELS_DIR", "models"))
+
+# CTranslate2 compute types accepted by /models/{model_name}/load
+SUPPORTED_COMPUTE_TYPES = {"float16", "int8_float16", "int8", "float32", "int8_float32", "bfloat16", "int8_bfloat16"}
+
+# Uploads are copied to disk in chunks of this size instead of being read into memory
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Uploads are staged on RAM-backed tmpfs when it is writable, skipping the disk round-trip
+WHISPER_TMPDIR = os.getenv("WHISPER_TMPDIR", "/dev/shm")
+UPLOAD_DIR = WHISPER_TMPDIR if os.path.isdir(WHISPER_TMPDIR) and os.access(WHISPER_TMPDIR, os.W_OK) else None
+
+# Spill multipart uploads from memory to a temp file once they exceed this size
+MultiPartParser.max_file_size = int(os.getenv("SPOOLED_TMP_MAX_SIZE", str(UPLOAD_CHUNK_SIZE)))
+
+# Finished transcriptions keyed by audio content hash and request options
+TRANSCRIPTION_CACHE_DIR = os.getenv("TRANSCRIPTION_CACHE_DIR", "cache")
+TRANSCRIPTION_CACHE_SIZE = int(os.getenv("TRANSCRIPTION_CACHE_SIZE", str(10 * 1024**3)))
+_transcription_cache = diskcache.Cache(TRANSCRIPTION_CACHE_DIR, size_limit=TRANSCRIPTION_CACHE_SIZE)
+
+# Transcriptions running in parallel; each gets its own CTranslate2 worker
+GPU_WORKERS = int(os.getenv("GPU_WORKERS", "2"))
+
+# Inference runs here so the event loop keeps serving requests
+_executor = ThreadPoolExecutor(max_workers=GPU_WORKERS, thread_name_prefix="whisper")
+
+# Number of short clips from concurrent requests, or 30s chunks of one long upload,
+# decoded together in one forward pass (1 disables batching)
+MAX_BATCH = int(os.getenv("MAX_BATCH", "8"))
+
+# Micro-batching: short clips arriving within MAX_WAIT_MS share one encoder/decoder pass
+MAX_WAIT_MS = int(os.getenv("MAX_WAIT_MS", "20"))
+_batch_queue: Optional[asyncio.Queue] = None
+_batch_task: Optional[asyncio.Task] = None
 
 class TranscriptionResponse(BaseModel):
     text: str
@@ -42,7 +113,9 @@ class HealthResponse(BaseModel):
     status: str
     gpu_available: bool
     loaded_models: List[str]
+    compute_types: Dict[str, str] = {}
     memory_usage: Optional[str] = None
+    vram_headroom: Optional[str] = None
 
 @app.on_event("startup")
 async def startup_event():
@@ -50,8 +123,7 @@ async def startup_event():
     logger.info("🚀 Starting Remote Whisper GPU Server")
     
     # Check GPU availability
-    import torch
-    gpu_available = torch.cuda.is_available()
+    gpu_available = cuda_available()
     logger.info(f"🎮 GPU Available: {gpu_available}")
     
     if gpu_available:
@@ -59,50 +131,409 @@ async def startup_event():
         for i in range(torch.cuda.device_count()):
             logger.info(f"🎮 GPU {i}: {torch.cuda.get_device_name(i)}")
     
+    logger.info(f"💾 Upload staging directory: {UPLOAD_DIR or tempfile.gettempdir()}")
+    
+    # Start micro-batching loop
+    global _batch_queue, _batch_task
+    if MAX_BATCH > 1:
+        _batch_queue = asyncio.Queue()
+        _batch_task = asyncio.create_task(batch_loop())
+    
     # Load default model
     try:
         default_model = os.getenv("DEFAULT_MODEL", "base")
         logger.info(f"📦 Loading default model: {default_model}")
-        load_model(default_model)
+        whisper_model = load_model(default_model)
         logger.info("✅ Default model loaded successfully")
     except Exception as e:
         logger.warning(f"⚠️  Failed to load default model: {e}")
+        return
+    
+    # Run one inference on silence so kernel loading and memory pool growth happen
+    # at boot instead of in the first user request
+    try:
+        warmup_start = time.time()
+        # Shorter than one 30s window, which the encoder pads to full length anyway
+        silence = np.zeros(16000 * 10, dtype=np.float32)
+        warmup_options = {"language": "en", "word_timestamps": False, "vad_filter": False}
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(_executor, _run_transcribe, whisper_model, silence, warmup_options)
+        logger.info(f"🔥 Warmup completed in {time.time() - warmup_start:.1f}s")
+    except Exception as e:
+        logger.warning(f"⚠️  Warmup failed: {e}")
+
+def save_upload(source, destination) -> str:
+    """Copy an upload to disk in chunks, returning the hex digest of its content"""
+    digest = blake3()
+    while True:
+        chunk = source.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            break
+        digest.update(chunk)
+        destination.write(chunk)
+    return digest.hexdigest()
 
-def load_model(model_name: str) -> Any:
-    """Load and cache a Whisper model"""
-    if model_name in _models:
-        return _models[model_name]
+# Compile the GPU feature extraction with torch.compile (set to 0 to run eagerly)
+TORCH_COMPILE = os.getenv("TORCH_COMPILE", "1") == "1"
+
+def _log_mel_from_stft(stft: Any, mel_filters: Any) -> Any:
+    """Mel projection and Whisper normalization of an STFT, applied over the whole input"""
+    magnitudes = stft[..., :-1].abs() ** 2
+    mel_spec = mel_filters @ magnitudes
     
-    logger.info(f"📦 Loading model: {model_name}")
-    start_time = time.time()
+    # Same normalization as the numpy implementation
+    log_spec = torch.clamp(mel_spec, min=1e-10).log10()
+    log_spec = torch.maximum(log_spec, log_spec.max() - 8.0)
+    return (log_spec + 4.0) / 4.0
+
+class TorchFeatureExtractor(FeatureExtractor):
+    """Log-mel feature extractor that runs the STFT and mel projection on the GPU
+    
+    Drop-in replacement for faster-whisper's numpy implementation; only the raw PCM
+    is copied to the device and the Hann window and mel filterbank stay resident.
+    """
+    
+    def __init__(self, device: str = "cuda", **kwargs):
+        super().__init__(**kwargs)
+        self.device = torch.device(device)
+        self.window = torch.hann_window(self.n_fft, device=self.device)
+        self.mel_filters_gpu = torch.from_numpy(self.mel_filters).to(self.device)
+        
+        # Fuses the elementwise ops after the STFT; input lengths vary, so shapes are
+        # dynamic and CUDA-graph modes would re-record for every new length
+        self.log_mel = _log_mel_from_stft
+        if TORCH_COMPILE and self.device.type == "cuda" and hasattr(torch, "compile"):
+            self.log_mel = torch.compile(_log_mel_from_stft, dynamic=True)
+    
+    def __call__(self, waveform, padding=160, chunk_length=None):
+        if chunk_length is not None:
+            self.n_samples = chunk_length * self.sampling_rate
+            self.nb_max_frames = self.n_samples // self.hop_length
+        
+        with torch.inference_mode():
+            audio = torch.from_numpy(waveform).float()
+            if self.device.type == "cuda":
+                audio = audio.pin_memory()
+            audio = audio.to(self.device, non_blocking=True)
+            if padding:
+                audio = torch.nn.functional.pad(audio, (0, padding))
+            
+            stft = torch.stft(audio, self.n_fft, self.hop_length, window=self.window, return_complex=True)
+            try:
+                log_spec = self.log_mel(stft, self.mel_filters_gpu)
+            except Exception as e:
+                if self.log_mel is _log_mel_from_stft:
+                    raise
+                logger.warning(f"⚠️  torch.compile failed, using eager feature extraction: {e}")
+                self.log_mel = _log_mel_from_stft
+                log_spec = self.log_mel(stft, self.mel_filters_gpu)
+            
+            return log_spec.cpu().numpy()
+
+def cuda_available() -> bool:
+    """Whether a CUDA device can be used"""
+    return _HAS_TORCH and torch.cuda.is_available()
+
+def vram_usage() -> Optional[tuple]:
+    """Return (used, budget) GPU memory in bytes, or None without a GPU"""
+    if not cuda_available():
+        return None
+    
+    # Device-wide numbers also cover CTranslate2 allocations, which torch does not track
+    free, total = torch.cuda.mem_get_info()
+    budget = MAX_VRAM_BYTES or int(total * 0.9)
+    return total - free, budget
+
+def evict_models_over_budget(keep: str) -> None:
+    """Drop least recently used models until GPU memory use fits the VRAM budget"""
+    usage = vram_usage()
+    while usage and usage[0] > usage[1] and len(_models) > 1:
+        name = next(iter(_models))
+        if name == keep:
+            break
+        
+        del _models[name]
+        _model_compute_types.pop(name, None)
+        gc.collect()
+        torch.cuda.empty_cache()
+        
+        logger.info(f"♻️  Evicted least recently used model: {name}")
+        usage = vram_usage()
+
+def load_model(model_name: str, compute_type: Optional[str] = None) -> Any:
+    """Load and cache a Whisper model, reloading it if a different compute type is requested"""
+    if compute_type is not None and compute_type not in SUPPORTED_COMPUTE_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported compute type: {compute_type}")
+    
+    while True:
+        with _models_lock:
+            if model_name in _models and compute_type in (None, _model_compute_types.get(model_name)):
+                _models.move_to_end(model_name)
+                return _models[model_name]
+            
+            pending = _model_loads.get(model_name)
+            if pending is None:
+                pending = Future()
+                _model_loads[model_name] = pending
+                break
+        
+        # Another thread is loading this model; wait for it outside the lock, then
+        # check the cache again in case it was loaded with a different compute type
+        error = pending.exception()
+        if error is not None:
+            raise error
     
     try:
-        model = whisper.load_model(model_name)
+        model, compute_type = _build_model(model_name, compute_type)
+    except Exception as e:
+        with _models_lock:
+            _model_loads.pop(model_name, None)
+        pending.set_exception(e)
+        raise
+    
+    with _models_lock:
         _models[model_name] = model
+        _models.move_to_end(model_name)
+        _model_compute_types[model_name] = compute_type
+        _model_loads.pop(model_name, None)
+        pending.set_result(model)
+        evict_models_over_budget(keep=model_name)
+    return model
+
+def default_compute_type() -> str:
+    """Compute type models are loaded with when none is requested"""
+    # int8 weights with fp16 activations halve weight traffic on GPU; plain int8 on CPU
+    return os.getenv("COMPUTE_TYPE", "int8_float16" if cuda_available() else "int8")
+
+def _build_model(model_name: str, compute_type: Optional[str]) -> tuple:
+    """Construct a model without touching the cache, returning it with its compute type"""
+    device = "cuda" if cuda_available() else "cpu"
+    
+    if compute_type is None:
+        compute_type = default_compute_type()
+    
+    logger.info(f"📦 Loading model: {model_name} ({compute_type})")
+    start_time = time.time()
+    
+    try:
+        model_kwargs = {
+            "device": device,
+            "compute_type": compute_type,
+            "num_workers": GPU_WORKERS,
+            "download_root": str(MODELS_DIR)
+        }
+        try:
+            # Reuse the already converted model on disk without contacting the Hugging Face Hub
+            model = WhisperModel(model_name, local_files_only=True, **model_kwargs)
+        except Exception:
+            logger.info(f"⬇️  Model '{model_name}' not found in {MODELS_DIR}, downloading")
+            model = WhisperModel(model_name, **model_kwargs)
+        
+        if device == "cuda":
+            model.feature_extractor = TorchFeatureExtractor(device=device, **model.feat_kwargs)
         load_time = time.time() - start_time
         logger.info(f"✅ Model '{model_name}' loaded in {load_time:.1f}s")
-        return model
+        return model, compute_type
     except Exception as e:
         logger.error(f"❌ Failed to load model '{model_name}': {e}")
         raise HTTPException(status_code=500, detail=f"Failed to load model: {e}")
 
+def _run_transcribe(whisper_model: Any, audio: Any, transcribe_options: Dict[str, Any]):
+    """Run a transcription of a file path or 16 kHz float32 array to completion on an executor thread"""
+    if MAX_BATCH > 1:
+        # Keep timestamp tokens so segments stay phrase-level instead of whole VAD chunks
+        pipeline = BatchedInferencePipeline(model=whisper_model)
+        segments_iter, info = pipeline.transcribe(
+            audio, batch_size=MAX_BATCH, without_timestamps=False, **transcribe_options
+        )
+    else:
+        segments_iter, info = whisper_model.transcribe(audio, **transcribe_options)
+    
+    # Segments are generated lazily (decoding happens while iterating), so the
+    # length is unknown up front; bind the hot lookups once instead of per segment
+    include_words = bool(transcribe_options.get("word_timestamps"))
+    segments = []
+    append = segments.append
+    for i, segment in enumerate(segments_iter):
+        segment_data = {
+            "id": i,
+            "start": segment.start,
+            "end": segment.end,
+            "text": segment.text.strip(),
+            "avg_logprob": segment.avg_logprob,
+            "no_speech_prob": segment.no_speech_prob
+        }
+        
+        words = segment.words
+        if include_words and words:
+            segment_data["words"] = [
+                {"start": w.start, "end": w.end, "word": w.word, "probability": w.probability}
+                for w in words
+            ]
+        
+        append(segment_data)
+    
+    return segments, info
+
+def run_batch(whisper_model: Any, audios: List[Any], options: Dict[str, Any]) -> List[tuple]:
+    """Decode short clips (each at most 30s) from several requests in one forward pass
+    
+    Mirrors what transcribe does for a single 30s window: greedy or beam decoding at
+    one temperature with timestamp tokens, split into phrase-level segments.
+    Returns (segments, language) per clip.
+    """
+    # Log-mel normalization is per clip, so extract each clip's features and stack them
+    features = np.stack([
+        pad_or_trim(whisper_model.feature_extractor(audio)[..., :-1]) for audio in audios
+    ])
+    encoder_output = whisper_model.encode(features)
+    
+    multilingual = whisper_model.model.is_multilingual
+    if options.get("language"):
+        languages = [options["language"]] * len(audios)
+    elif multilingual:
+        languages = [langs[0][0][2:-2] for langs in whisper_model.model.detect_language(encoder_output)]
+    else:
+        languages = ["en"] * len(audios)
+    
+    # Prompts can differ per clip (detected language), so each row gets its own
+    tokenizers: Dict[str, Tokenizer] = {}
+    prompts = []
+    initial_prompt = options.get("initial_prompt")
+    for language in languages:
+        tokenizer = tokenizers.get(language)
+        if tokenizer is None:
+            tokenizer = Tokenizer(whisper_model.hf_tokenizer, multilingual, task="transcribe", language=language)
+            tokenizers[language] = tokenizer
+        previous_tokens = tokenizer.encode(" " + initial_prompt.strip()) if initial_prompt else []
+        prompts.append(whisper_model.get_prompt(tokenizer, previous_tokens))
+    
+    temperature = options.get("temperature", 0.0)
+    if temperature > 0:
+        decode_kwargs = {"beam_size": 1, "sampling_topk": 0, "sampling_temperature": temperature}
+    else:
+        decode_kwargs = {"beam_size": 5, "patience": 1}
+    
+    results = whisper_model.model.generate(
+        encoder_output,
+        prompts,
+        max_length=whisper_model.max_length,
+        suppress_blank=True,
+        suppress_tokens=list(get_suppressed_tokens(next(iter(tokenizers.values())), [-1])),
+        return_scores=True,
+        return_no_speech_prob=True,
+        **decode_kwargs
+    )
+    
+    outputs = []
+    for audio, language, result in zip(audios, languages, results):
+        tokenizer = tokenizers[language]
+        tokens = result.sequences_ids[0]
+        avg_logprob = result.scores[0] * len(tokens) / (len(tokens) + 1)
+        
+        # Same silence check transcribe applies to each window
+        if result.no_speech_prob > 0.6 and avg_logprob < -1.0:
+            outputs.append(([], language))
+            continue
+        
+        duration = len(audio) / whisper_model.feature_extractor.sampling_rate
+        subsegments, _, _ = whisper_model._split_segments_by_timestamps(
+            tokenizer=tokenizer,
+            tokens=tokens,
+            time_offset=0.0,
+            segment_size=int(ceil(duration) * whisper_model.frames_per_second),
+            segment_duration=duration,
+            seek=0
+        )
+        segments = []
+        for subsegment in subsegments:
+            text = tokenizer.decode(subsegment["tokens"]).strip()
+            if not text:
+                continue
+            segments.append({
+                "id": len(segments),
+                "start": round(subsegment["start"], 3),
+                "end": round(min(subsegment["end"], duration), 3),
+                "text": text,
+                "avg_logprob": avg_logprob,
+                "no_speech_prob": result.no_speech_prob
+            })
+        outputs.append((segments, language))
+    return outputs
+
+async def batch_loop():
+    """Collect queued short-clip requests and run them through the model in batches"""
+    loop = asyncio.get_running_loop()
+    
+    while True:
+        batch = [await _batch_queue.get()]
+        deadline = loop.time() + MAX_WAIT_MS / 1000
+        
+        while len(batch) < MAX_BATCH:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(_batch_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        
+        # Requests can only share a pass when model and decoding options match
+        groups: Dict[Any, List[Dict[str, Any]]] = {}
+        for item in batch:
+            groups.setdefault(item["key"], []).append(item)
+        
+        for items in groups.values():
+            try:
+                results = await loop.run_in_executor(
+                    _executor, run_batch, items[0]["model"], [item["audio"] for item in items], items[0]["options"]
+                )
+                logger.info(f"📦 Batched {len(items)} transcription request(s)")
+                for item, result in zip(items, results):
+                    if not item["future"].done():
+                        item["future"].set_result(result)
+            except Exception as e:
+                for item in items:
+                    if not item["future"].done():
+                        item["future"].set_exception(e)
+
+async def transcribe_batched(whisper_model: Any, audio: Any, options: Dict[str, Any]) -> tuple:
+    """Queue a short clip for batched transcription and wait for its (segments, language)"""
+    future = asyncio.get_running_loop().create_future()
+    key = (id(whisper_model), options.get("language"), options.get("initial_prompt"), options.get("temperature"))
+    await _batch_queue.put({
+        "key": key,
+        "model": whisper_model,
+        "audio": audio,
+        "options": options,
+        "future": future
+    })
+    return await future
+
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    import torch
-    
     try:
+        gpu_available = cuda_available()
         memory_info = None
-        if torch.cuda.is_available():
+        if gpu_available:
             memory_allocated = torch.cuda.memory_allocated() / 1024**3  # GB
             memory_reserved = torch.cuda.memory_reserved() / 1024**3   # GB
             memory_info = f"{memory_allocated:.1f}GB allocated, {memory_reserved:.1f}GB reserved"
         
+        headroom_info = None
+        usage = vram_usage()
+        if usage:
+            headroom_info = f"{(usage[1] - usage[0]) / 1024**3:.1f}GB below {usage[1] / 1024**3:.1f}GB budget"
+        
+        # Copying the dicts is atomic under the GIL, so this never waits on _models_lock
         return HealthResponse(
             status="healthy",
-            gpu_available=torch.cuda.is_available(),
-            loaded_models=list(_models.keys()),
-            memory_usage=memory_info
+            gpu_available=gpu_available,
+            loaded_models=list(_models),  # least recently used first
+            compute_types=dict(_model_compute_types),
+            memory_usage=memory_info,
+            vram_headroom=headroom_info
         )
     except Exception as e:
         logger.error(f"Health check failed: {e}")
@@ -122,7 +553,7 @@ async def transcribe_audio(
     temperature: float = Form(0.0, description="Temperature for sampling (0.0 = deterministic)"),
     word_timestamps: bool = Form(True, description="Include word-level timestamps")
 ):
-    """Transcribe audio file using Whisper"""
+    """Transcribe audio file using Whisper, reusing cached results for identical audio"""
     start_time = time.time()
     temp_file = None
     
@@ -131,28 +562,43 @@ async def transcribe_audio(
         if not audio.filename:
             raise HTTPException(status_code=400, detail="No filename provided")
         
-        file_size = 0
-        content = await audio.read()
-        file_size = len(content)
+        # Stream uploaded file to temporary location without buffering it in memory;
+        # the blocking reads and writes run on a thread so other uploads keep flowing
+        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(audio.filename).suffix,
+                                         dir=UPLOAD_DIR, buffering=UPLOAD_CHUNK_SIZE) as tmp:
+            temp_file = tmp.name
+            content_hash = await run_in_threadpool(save_upload, audio.file, tmp)
+            file_size = tmp.tell()
         
         logger.info(f"🎤 Transcription request: {audio.filename} ({file_size/1024/1024:.1f}MB)")
         logger.info(f"⚙️  Model: {model}, Language: {language or 'auto'}, Prompt: {bool(prompt)}")
         
-        # Load model
-        whisper_model = load_model(model)
-        
-        # Save uploaded file to temporary location
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(audio.filename).suffix) as tmp:
-            tmp.write(content)
-            temp_file = tmp.name
+        # Identical audio with identical options always produces the same transcription;
+        # the compute type and batch size change numerics and segmentation, so they are
+        # part of the key (a model that isn't loaded yet will use the default type)
+        compute_type = _model_compute_types.get(model) or default_compute_type()
+        cache_key = (
+            f"{content_hash}:{model}:{compute_type}:b{MAX_BATCH}:"
+            f"{language or ''}:{prompt or ''}:{temperature}:{word_timestamps}"
+        )
+        cached = await run_in_threadpool(_transcription_cache.get, cache_key)
+        if cached is not None:
+            logger.info(f"⚡ Cache hit for {audio.filename}")
+            cached["processing_time"] = time.time() - start_time
+            return ORJSONResponse(cached, headers={"X-Cache": "HIT"})
         
         logger.info(f"💾 Saved to temp file: {temp_file}")
         
+        # Load model; a first request for a model may download and convert it, which
+        # must not stall the event loop (and /health) for the whole load
+        loop = asyncio.get_running_loop()
+        whisper_model = await loop.run_in_executor(None, load_model, model)
+        
         # Prepare transcription options
         transcribe_options = {
             "temperature": temperature,
             "word_timestamps": word_timestamps,
-            "verbose": False  # Disable verbose logging to avoid cluttering
+            "vad_filter": True
         }
         
         if language:
@@ -165,44 +611,44 @@ async def transcribe_audio(
         logger.info("🚀 Starting transcription...")
         transcription_start = time.time()
         
-        result = whisper_model.transcribe(temp_file, **transcribe_options)
+        # Short clips without word timestamps share a batched pass with other requests;
+        # longer files and word-timestamp requests are transcribed on their own
+        batched = None
+        audio_input = temp_file
+        if _batch_queue is not None and not word_timestamps:
+            sampling_rate = whisper_model.feature_extractor.sampling_rate
+            audio_input = await run_in_threadpool(decode_audio, temp_file, sampling_rate)
+            if len(audio_input) <= 30 * sampling_rate:
+                batched = await transcribe_batched(whisper_model, audio_input, transcribe_options)
+        
+        if batched is not None:
+            segments, detected_language = batched
+        else:
+            segments, info = await loop.run_in_executor(
+                _executor, _run_transcribe, whisper_model, audio_input, transcribe_options
+            )
+            detected_language = info.language
         
         transcription_time = time.time() - transcription_start
         logger.info(f"✅ Transcription completed in {transcription_time:.1f}s")
         
-        # Format response
-        segments = []
-        for i, segment in enumerate(result.get("segments", [])):
-            segment_data = {
-                "id": i,
-                "start": segment.get("start", 0.0),
-                "end": segment.get("end", 0.0),
-                "text": segment.get("text", "").strip()
-            }
-            
-            # Add optional fields if available
-            if "avg_logprob" in segment:
-                segment_data["avg_logprob"] = segment["avg_logprob"]
-            if "no_speech_prob" in segment:
-                segment_data["no_speech_prob"] = segment["no_speech_prob"]
-            if word_timestamps and "words" in segment:
-                segment_data["words"] = segment["words"]
-            
-            segments.append(segment_data)
-        
         processing_time = time.time() - start_time
         
-        response = TranscriptionResponse(
-            text=result["text"].strip(),
-            language=result.get("language", "unknown"),
-            segments=segments,
-            processing_time=processing_time,
-            model_used=model
-        )
+        # Built as a plain dict matching TranscriptionResponse; validating hundreds of
+        # segments through Pydantic only to serialize them again is wasted work
+        text = " ".join(segment["text"] for segment in segments)
+        content = {
+            "text": text,
+            "language": detected_language or "unknown",
+            "segments": segments,
+            "processing_time": processing_time,
+            "model_used": model
+        }
+        await run_in_threadpool(_transcription_cache.set, cache_key, content)
         
-        logger.info(f"🎉 Response ready: {len(response.text)} chars, {len(segments)} segments, {processing_time:.1f}s total")
+        logger.info(f"🎉 Response ready: {len(text)} chars, {len(segments)} segments, {processing_time:.1f}s total")
         
-        return response
+        return ORJSONResponse(content, headers={"X-Cache": "MISS"})
         
     except Exception as e:
         logger.error(f"❌ Transcription failed: {e}")
@@ -235,32 +681,40 @@ async def list_models():
     }
 
 @app.post("/models/{model_name}/load")
-async def preload_model(model_name: str):
-    """Preload a specific model"""
+async def preload_model(model_name: str, compute_type: Optional[str] = None):
+    """Preload a specific model, optionally with a specific compute type"""
     try:
-        load_model(model_name)
-        return {"status": "success", "message": f"Model '{model_name}' loaded successfully"}
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, load_model, model_name, compute_type)
+        return {
+            "status": "success",
+            "message": f"Model '{model_name}' loaded successfully",
+            "compute_type": _model_compute_types[model_name]
+        }
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.delete("/models/{model_name}")
-async def unload_model(model_name: str):
-    """Unload a specific model to free memory"""
-    if model_name in _models:
-        del _models[model_name]
-        
+def _unload_model(model_name: str) -> bool:
+    """Drop a model from the cache and free its memory, returning whether it was loaded"""
+    with _models_lock:
+        unloaded = _models.pop(model_name, None) is not None
+        _model_compute_types.pop(model_name, None)
+    
+    if unloaded:
         # Force garbage collection
-        import gc
         gc.collect()
         
         # Clear CUDA cache if available
-        try:
-            import torch
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-        except:
-            pass
-            
+        if cuda_available():
+            torch.cuda.empty_cache()
+    return unloaded
+
+@app.delete("/models/{model_name}")
+async def unload_model(model_name: str):
+    """Unload a specific model to free memory"""
+    if await run_in_threadpool(_unload_model, model_name):
         logger.info(f"🗑️  Unloaded model: {model_name}")
         return {"status": "success", "message": f"Model '{model_name}' unloaded"}
     else:
@@ -270,7 +724,17 @@ if __name__ == "__main__":
     # Configuration
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8080"))
-    workers = int(os.getenv("WORKERS", "1"))
+    
+    # Every worker process loads its own models, so a GPU is shared by one worker that
+    # scales through GPU_WORKERS; CPU-only servers scale out by processes instead
+    gpu_available = cuda_available()
+    workers = int(os.getenv("WORKERS", "1" if gpu_available else str(max(1, (os.cpu_count() or 1) // 4))))
+    if gpu_available and workers > 1:
+        logger.warning(f"⚠️  Ignoring WORKERS={workers} on GPU server, using a single worker")
+        workers = 1
+    
+    # Keep idle connections open long enough for pooled batch clients to reuse them between uploads
+    keep_alive = int(os.getenv("KEEP_ALIVE_TIMEOUT", "75"))
     
     logger.info(f"🌟 Starting server on {host}:{port} with {workers} workers")
     
@@ -279,6 +743,9 @@ if __name__ == "__main__":
         host=host,
         port=port,
         workers=workers,
+        loop="uvloop",
+        http="httptools",
         log_level="info",
-        access_log=True
+        access_log=True,
+        timeout_keep_alive=keep_alive
     )
\ No newline at end of file
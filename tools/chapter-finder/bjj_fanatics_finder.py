@@ -6,14 +6,28 @@ Simple script to find BJJ Fanatics product pages from video filenames.
 Extracted from the BJJ Video Analyzer project.
 """
 
+import os
 import sys
+import asyncio
 import re
+import atexit
+import importlib.util
+import json
+import shelve
 import logging
 import time
 import random
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional
+from urllib.parse import urlsplit, urlunsplit
+from typing import Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
 try:
     from googlesearch import search
     GOOGLE_AVAILABLE = True
@@ -21,12 +35,22 @@ except ImportError:
     GOOGLE_AVAILABLE = False
     logging.warning("googlesearch-python not available")
 
+try:
+    from selectolax.parser import HTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+    logging.debug("selectolax not available, falling back to BeautifulSoup")
+
 try:
     from bs4 import BeautifulSoup
     BS4_AVAILABLE = True
 except ImportError:
     BS4_AVAILABLE = False
-    logging.warning("BeautifulSoup not available")
+    if not SELECTOLAX_AVAILABLE:
+        logging.warning("BeautifulSoup not available")
+
+HTML_PARSER_AVAILABLE = SELECTOLAX_AVAILABLE or BS4_AVAILABLE
 
 try:
     from duckduckgo_search import DDGS
@@ -36,18 +60,147 @@ except ImportError:
     logging.debug("duckduckgo-search not available")
 
 try:
-    from selenium import webdriver
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.support.ui import WebDriverWait
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.chrome.options import Options
-    from selenium.common.exceptions import TimeoutException, WebDriverException
-    SELENIUM_AVAILABLE = True
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+    logging.debug("numpy not available, matching existing results in pure Python")
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logging.debug("pyahocorasick not available, using trigram lookups for URL word matching")
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
 except ImportError:
-    SELENIUM_AVAILABLE = False
+    AIOHTTP_AVAILABLE = False
+    logging.debug("aiohttp not available")
+
+# Selenium is imported lazily by the functions that drive Chrome, so runs that never
+# fall back to browser automation don't pay for loading it
+SELENIUM_AVAILABLE = importlib.util.find_spec("selenium") is not None
+if not SELENIUM_AVAILABLE:
     logging.debug("selenium not available")
 
 
+# Precompiled patterns used by parse_video_filename
+_RE_TRAIL_NUM = re.compile(r'\d+\.mp4$')
+_RE_SEP = re.compile(r'[_\-]')
+# "by" before a capital, or "of"/"to"/"the" between a lowercase letter and a capital
+_RE_BOUNDARY = re.compile(r'by(?=[A-Z])|(?<=[a-z])(?:of|to|the)(?=[A-Z])')
+_RE_WORDS = re.compile(r'[A-Z][a-z]*|[a-z]+')
+
+# Connector words dropped from instructor and series names ("by" is handled separately)
+_CONNECTORS = frozenset({'the', 'of', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'with', 'from'})
+_STOPWORDS = _CONNECTORS | {'by'}
+
+# Common BJJ technique/series indicators (these are more likely to be in series titles)
+_SERIES_INDICATORS = frozenset({
+    'guard', 'control', 'submission', 'sweep', 'escape', 'pass', 'position', 'mount',
+    'choke', 'lock', 'system', 'fundamentals', 'basics', 'blocks', 'building'
+})
+
+
+# Caps on concurrent requests per search provider when filenames are searched in parallel
+_DDG_SEMAPHORE = threading.Semaphore(2)
+_GOOGLE_SEMAPHORE = threading.Semaphore(1)
+_BJJ_SEMAPHORE = threading.Semaphore(4)
+
+_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+_HTTP_TIMEOUT = (3, 10)  # (connect, read) seconds
+
+# Runs the blocking search backends for find_product_page_async. Kept outside asyncio's
+# default executor so a finished race doesn't wait on the slower backends at loop shutdown.
+_BACKEND_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='bjj-search')
+
+# One keep-alive requests.Session per worker thread
+_thread_local = threading.local()
+
+# Politeness delay between series searches (AIMD): shrinks by _DELAY_DECREASE while
+# responses come back 2xx and fast, doubles on a 429/503 or a failed search
+_DELAY_LOCK = threading.Lock()
+_DELAY_INITIAL = 10.0
+_DELAY_MIN = 1.0
+_DELAY_MAX = 30.0
+_DELAY_DECREASE = 0.8
+_DELAY_FAST_LATENCY = 1.0  # seconds
+_delay_current = _DELAY_INITIAL
+_latency_ewma = None
+
+
+def _record_response_health(status: Optional[int], latency: float) -> None:
+    """Feed one search response into the adaptive delay.
+    
+    Args:
+        status: HTTP status code, or None when the request or search failed
+        latency: Seconds the request took
+    """
+    global _delay_current, _latency_ewma
+    with _DELAY_LOCK:
+        _latency_ewma = latency if _latency_ewma is None else 0.7 * _latency_ewma + 0.3 * latency
+        if status is None or status in (429, 503):
+            _delay_current = min(_DELAY_MAX, _delay_current * 2)
+        elif 200 <= status < 300 and _latency_ewma < _DELAY_FAST_LATENCY:
+            _delay_current = max(_DELAY_MIN, _delay_current * _DELAY_DECREASE)
+
+
+def _next_search_delay() -> float:
+    """Return how long a worker should wait before its next series search."""
+    with _DELAY_LOCK:
+        return random.uniform(_delay_current, _delay_current * 1.3)
+
+
+def _record_response(response: requests.Response, *args, **kwargs) -> None:
+    """requests response hook reporting status and latency to the adaptive delay."""
+    _record_response_health(response.status_code, response.elapsed.total_seconds())
+
+
+def _build_session() -> requests.Session:
+    """Create a pooled requests.Session with retries and default headers.
+    
+    Rate-limit and gateway errors are retried with backoff; the last response is
+    still returned (not raised) so the adaptive delay sees its status.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers['User-Agent'] = _USER_AGENT
+    session.hooks['response'].append(_record_response)
+    return session
+
+
+def _get_session() -> requests.Session:
+    """Return the requests.Session owned by the calling thread."""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = _build_session()
+        _thread_local.session = session
+    return session
+
+
+class SearchTerms(NamedTuple):
+    """Words parsed from a video filename (immutable so parse results can be cached)."""
+    instructor: Tuple[str, ...]
+    series: Tuple[str, ...]
+    all_words: Tuple[str, ...]
+    instructor_lc: Tuple[str, ...]  # Lowercased instructor words for matching
+    series_lc: Tuple[str, ...]      # Lowercased series words for matching
+
+
 def setup_logging(verbose: bool = False):
     """Setup basic logging."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -57,58 +210,54 @@ def setup_logging(verbose: bool = False):
     )
 
 
-def parse_video_filename(filename: str) -> Dict[str, List[str]]:
+@lru_cache(maxsize=8192)
+def parse_video_filename(filename: str) -> SearchTerms:
     """Parse video filename to extract instructor name and series title.
     
     Args:
         filename: Video filename (e.g., "JustStandUpbyCraigJones1.mp4")
         
     Returns:
-        Dictionary with 'instructor' and 'series' word lists
+        SearchTerms with instructor, series and all_words tuples (plus lowercased variants)
     """
     # Remove file extension and common patterns
-    clean_name = re.sub(r'\d+\.mp4$', '', filename)  # Remove trailing numbers and .mp4
-    clean_name = re.sub(r'[_\-]', ' ', clean_name)    # Replace underscores and dashes with spaces
-    
-    # Handle patterns like "Reintroducedby" -> "Reintroduced by"
-    clean_name = re.sub(r'(by)([A-Z])', r' \1 \2', clean_name)  # "byAdam" -> " by Adam"
-    clean_name = re.sub(r'([a-z])(by)([A-Z])', r'\1 \2 \3', clean_name)  # "Reintroducedby" -> "Reintroduced by"
+    clean_name = _RE_TRAIL_NUM.sub('', filename)  # Remove trailing numbers and .mp4
+    clean_name = _RE_SEP.sub(' ', clean_name)      # Replace underscores and dashes with spaces
     
-    # Handle common word boundaries that might not have capitals
-    # "Blocksof" -> "Blocks of", "Guardby" -> "Guard by"
-    clean_name = re.sub(r'([a-z])(of)([A-Z])', r'\1 \2 \3', clean_name)
-    clean_name = re.sub(r'([a-z])(to)([A-Z])', r'\1 \2 \3', clean_name)
-    clean_name = re.sub(r'([a-z])(the)([A-Z])', r'\1 \2 \3', clean_name)
+    # Handle word boundaries that might not have capitals in a single pass:
+    # "ReintroducedbyAdam" -> "Reintroduced by Adam", "BlocksofThe" -> "Blocks of The"
+    clean_name = _RE_BOUNDARY.sub(r' \g<0> ', clean_name)
     
     # Split on capital letters to separate words
-    words = re.findall(r'[A-Z][a-z]*|[a-z]+', clean_name)
+    words = _RE_WORDS.findall(clean_name)
     
     # Try to find "by" indicator to split instructor and series
-    by_index = -1
-    for i, word in enumerate(words):
-        if word.lower() == 'by':
-            by_index = i
-            break
+    words_lc = [word.lower() for word in words]
+    by_index = words_lc.index('by') if 'by' in words_lc else -1
     
+    # Single pass over the words: drop stop words and, if "by" was found, put
+    # everything before it in the series and everything after it in the instructor
     instructor_words = []
     series_words = []
+    all_words = []
+    for i, (word, word_lc) in enumerate(zip(words, words_lc)):
+        if word_lc in _CONNECTORS:
+            continue
+        if by_index == -1 or i < by_index:
+            series_words.append(word)
+        elif i > by_index:
+            instructor_words.append(word)
+        if word_lc != 'by':
+            all_words.append(word)
     
-    if by_index != -1:
-        # Found "by" - everything after "by" is instructor, everything before is series
-        series_words = [word for word in words[:by_index] if word.lower() not in ['the', 'of', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'with', 'from']]
-        instructor_words = [word for word in words[by_index+1:] if word.lower() not in ['the', 'of', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'with', 'from']]
-    else:
-        # No "by" found - use heuristics
-        # Filter out common stop words first
-        filtered_words = [word for word in words if word.lower() not in ['by', 'the', 'of', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'with', 'from']]
-        
-        # Common BJJ technique/series indicators (these are more likely to be in series titles)
-        series_indicators = ['guard', 'control', 'submission', 'sweep', 'escape', 'pass', 'position', 'mount', 'choke', 'lock', 'system', 'fundamentals', 'basics', 'blocks', 'building']
+    if by_index == -1:
+        # No "by" found - use heuristics on the stop word filtered words
+        filtered_words = series_words
         
         # Try to identify instructor name (usually last 2-3 words if no obvious series indicators)
         if len(filtered_words) >= 4:
             # Look for series indicators in the first part
-            has_series_indicators = any(word.lower() in series_indicators for word in filtered_words[:len(filtered_words)//2])
+            has_series_indicators = any(word.lower() in _SERIES_INDICATORS for word in filtered_words[:len(filtered_words)//2])
             
             if has_series_indicators:
                 # Likely pattern: [Series Title] [Instructor Name]
@@ -124,52 +273,63 @@ def parse_video_filename(filename: str) -> Dict[str, List[str]]:
             instructor_words = filtered_words[:2] if len(filtered_words) >= 2 else filtered_words
             series_words = filtered_words[len(instructor_words):]
     
-    # Clean up empty lists
-    instructor_words = [word for word in instructor_words if word]
-    series_words = [word for word in series_words if word]
-    all_words = [word for word in words if word.lower() not in ['by', 'the', 'of', 'and', 'or', 'in', 'on', 'at', 'to', 'for', 'with', 'from']]
-    
-    return {
-        'instructor': instructor_words,
-        'series': series_words,
-        'all_words': all_words
-    }
+    return SearchTerms(
+        instructor=tuple(instructor_words),
+        series=tuple(series_words),
+        all_words=tuple(all_words),
+        instructor_lc=tuple(word.lower() for word in instructor_words),
+        series_lc=tuple(word.lower() for word in series_words)
+    )
 
 
-def search_bjj_fanatics_selenium(search_terms: Dict[str, List[str]]) -> Optional[str]:
-    """Search BJJ Fanatics using Selenium to handle JavaScript-rendered content.
+# Generic/promotional products that are never the series being searched for
+_INVALID_URL_RE = re.compile(r'atos2025|gift-card|retreat|insiders-club|vip-retreat|fanatics-retreat')
+
+# On-disk filename -> product URL cache shared across runs
+_CACHE_PATH = os.environ.get('BJJ_FINDER_CACHE', '.bjj_finder_cache')
+_CACHE_MAX_ENTRIES = 5000
+_CACHE_LOCK = threading.Lock()
+_CACHE_TRIMMED = False
+
+# Any element that may link to a product on the bjjfanatics.com search page
+_PRODUCT_SELECTOR = ", ".join([
+    'a[href*="/products/"]',
+    '.product-item a',
+    '.grid-product__link',
+    '.product-card a',
+    '.product-link',
+    '.grid__item a'
+])
+
+# Shared headless Chrome instance, recycled after _DRIVER_MAX_USES searches
+_DRIVER = None
+_DRIVER_LOCK = threading.Lock()
+_DRIVER_USES = 0
+_DRIVER_MAX_USES = 50
+
+
+def _quit_driver() -> None:
+    """Quit the shared driver (caller holds _DRIVER_LOCK)."""
+    global _DRIVER, _DRIVER_USES
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        except Exception:
+            pass
+    _DRIVER = None
+    _DRIVER_USES = 0
+
+
+def _get_driver():
+    """Return the shared Chrome driver, creating or recycling it as needed (caller holds _DRIVER_LOCK)."""
+    global _DRIVER, _DRIVER_USES
+    if _DRIVER is not None and _DRIVER_USES >= _DRIVER_MAX_USES:
+        logging.debug(f"Recycling Selenium driver after {_DRIVER_USES} searches")
+        _quit_driver()
     
-    Args:
-        search_terms: Dictionary with instructor and series terms
-        
-    Returns:
-        BJJ Fanatics product URL if found, None otherwise
-    """
-    if not SELENIUM_AVAILABLE:
-        logging.debug("Selenium not available for browser automation")
-        return None
-        
-    driver = None
-    try:
-        # Try multiple search query strategies - INSTRUCTOR-FOCUSED
-        search_queries = []
-        
-        # Strategy 1: Instructor name only (most reliable)
-        if search_terms['instructor']:
-            instructor_query = ' '.join(search_terms['instructor'])
-            search_queries.append(f'"{instructor_query}"')
-        
-        # Strategy 2: Instructor + key series words (refined)
-        if search_terms['instructor'] and search_terms['series']:
-            instructor_query = ' '.join(search_terms['instructor'])
-            key_series = ' '.join(search_terms['series'][:2])  # Just 2 key words
-            search_queries.append(f'"{instructor_query}" {key_series}')
-        
-        # Strategy 3: Instructor + full series (fallback)
-        if search_terms['instructor'] and search_terms['series']:
-            instructor_query = ' '.join(search_terms['instructor'])
-            series_query = ' '.join(search_terms['series'])
-            search_queries.append(f'"{instructor_query}" {series_query}')
+    if _DRIVER is None:
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
         
         # Set up Chrome options for headless browsing
         chrome_options = Options()
@@ -178,103 +338,176 @@ def search_bjj_fanatics_selenium(search_terms: Dict[str, List[str]]) -> Optional
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-gpu")
         chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+        chrome_options.add_argument(f"--user-agent={_USER_AGENT}")
         
-        # Create driver
-        driver = webdriver.Chrome(options=chrome_options)
-        driver.set_page_load_timeout(30)
+        _DRIVER = webdriver.Chrome(options=chrome_options)
+        _DRIVER.set_page_load_timeout(30)
+    
+    _DRIVER_USES += 1
+    return _DRIVER
+
+
+def _shutdown_driver() -> None:
+    """Quit the shared Selenium driver if one is running."""
+    with _DRIVER_LOCK:
+        _quit_driver()
+
+
+atexit.register(_shutdown_driver)
+
+
+def _pick_best_product(urls: Iterable[str]) -> Optional[str]:
+    """Return the first bjjfanatics.com product URL that isn't a generic/promotional product."""
+    for url in urls:
+        if '/products/' in url and 'bjjfanatics.com' in url and _INVALID_URL_RE.search(url) is None:
+            return url
+    return None
+
+
+def _instructor_queries(search_terms: SearchTerms) -> Iterator[str]:
+    """Yield search queries from most to least reliable - INSTRUCTOR-FOCUSED.
+    
+    Queries are built lazily, so later strategies cost nothing when an earlier one succeeds.
+    """
+    if not search_terms.instructor:
+        return
+    instructor_query = ' '.join(search_terms.instructor)
+    
+    # Strategy 1: Instructor name only (most reliable)
+    yield f'"{instructor_query}"'
+    
+    if search_terms.series:
+        # Strategy 2: Instructor + key series words (refined)
+        key_series = ' '.join(search_terms.series[:2])  # Just 2 key words
+        yield f'"{instructor_query}" {key_series}'
         
-        # Try each search query until we find results
-        for search_query in search_queries:
-            logging.info(f"Selenium BJJ Fanatics search query: '{search_query}'")
-            
-            try:
-                # Navigate to BJJ Fanatics search page
-                search_url = f"https://bjjfanatics.com/search?q={requests.utils.quote(search_query)}"
-                logging.debug(f"Navigating to: {search_url}")
-                driver.get(search_url)
-                
-                # Wait for search results to load (JavaScript)
-                wait = WebDriverWait(driver, 15)
-                
-                # Try different selectors for product links
-                product_selectors = [
-                    'a[href*="/products/"]',
-                    '.product-item a',
-                    '.grid-product__link',
-                    '.product-card a',
-                    '.product-link',
-                    '.grid__item a'
-                ]
-                
-                product_links = []
-                
-                for selector in product_selectors:
-                    try:
-                        # Wait for elements to be present
-                        elements = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector)))
-                        
-                        for element in elements[:10]:  # Limit to first 10 results
-                            try:
-                                href = element.get_attribute('href')
-                                if href and '/products/' in href and 'bjjfanatics.com' in href:
-                                    # Filter out obviously wrong results - these are generic/promotional products
-                                    invalid_products = ['atos2025', 'gift-card', 'retreat', 'insiders-club', 'vip-retreat', 'fanatics-retreat']
-                                    if not any(invalid in href for invalid in invalid_products):
-                                        product_links.append(href)
-                            except:
-                                continue
-                        
-                        if product_links:
-                            break  # Found products with this selector
-                            
-                    except TimeoutException:
-                        logging.debug(f"Selector '{selector}' timed out")
-                        continue
-                
-                # Remove duplicates
-                product_links = list(dict.fromkeys(product_links))
-                
-                if product_links:
-                    logging.info(f"Selenium search found {len(product_links)} products with query: '{search_query}'")
-                    first_product = product_links[0]
-                    logging.info(f"Found BJJ Fanatics product via Selenium: {first_product}")
-                    return first_product
-                else:
-                    logging.debug(f"No valid products found with query: '{search_query}'")
-                    
-            except Exception as e:
-                logging.debug(f"Search query '{search_query}' failed: {e}")
-                continue
+        # Strategy 3: Instructor + full series (fallback)
+        series_query = ' '.join(search_terms.series)
+        yield f'"{instructor_query}" {series_query}'
+
+
+def search_bjj_fanatics_selenium(search_terms: SearchTerms) -> Optional[str]:
+    """Search BJJ Fanatics using Selenium to handle JavaScript-rendered content.
+    
+    Args:
+        search_terms: Parsed instructor and series terms
         
-        logging.warning("No products found via Selenium BJJ Fanatics search")
+    Returns:
+        BJJ Fanatics product URL if found, None otherwise
+    """
+    if not SELENIUM_AVAILABLE:
+        logging.debug("Selenium not available for browser automation")
         return None
+    
+    from selenium.common.exceptions import WebDriverException
+        
+    try:
+        with _DRIVER_LOCK:
+            driver = _get_driver()
+            return _search_with_driver(driver, _instructor_queries(search_terms))
             
     except WebDriverException as e:
         logging.error(f"Selenium WebDriver error: {e}")
+        _shutdown_driver()  # Recycle the broken driver on the next call
         return None
     except Exception as e:
         logging.error(f"Selenium BJJ Fanatics search failed: {e}")
         return None
-    finally:
-        if driver:
+
+
+def _element_hrefs(elements) -> Iterator[str]:
+    """Yield the href of each Selenium element, skipping ones that went stale."""
+    for element in elements:
+        try:
+            href = element.get_attribute('href')
+        except Exception:
+            continue
+        if href:
+            yield href
+
+
+def _search_with_driver(driver, search_queries: Iterable[str]) -> Optional[str]:
+    """Run search queries on bjjfanatics.com with the shared driver (caller holds _DRIVER_LOCK).
+    
+    Args:
+        driver: Selenium WebDriver instance
+        search_queries: Queries to try in order
+        
+    Returns:
+        First BJJ Fanatics product URL found, None otherwise
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException, WebDriverException
+    
+    # Try each search query until we find results
+    for search_query in search_queries:
+        logging.info(f"Selenium BJJ Fanatics search query: '{search_query}'")
+        
+        try:
+            # Navigate to BJJ Fanatics search page
+            search_url = f"https://bjjfanatics.com/search?q={requests.utils.quote(search_query)}"
+            logging.debug(f"Navigating to: {search_url}")
+            started = time.perf_counter()
+            try:
+                driver.get(search_url)
+            except Exception:
+                _record_response_health(None, time.perf_counter() - started)
+                raise
+            _record_response_health(200, time.perf_counter() - started)
+            
+            # Wait for search results to load (JavaScript)
+            wait = WebDriverWait(driver, 15)
+            
+            first_product = None
+            
             try:
-                driver.quit()
-            except:
-                pass
+                # Wait for the first element matching any product selector, then collect them all
+                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, _PRODUCT_SELECTOR)))
+                elements = driver.find_elements(By.CSS_SELECTOR, _PRODUCT_SELECTOR)
+                first_product = _pick_best_product(_element_hrefs(elements))
+                    
+            except TimeoutException:
+                logging.debug(f"No product elements appeared for query '{search_query}'")
+            
+            if first_product:
+                logging.info(f"Found BJJ Fanatics product via Selenium: {first_product} (query: '{search_query}')")
+                return first_product
+            else:
+                logging.debug(f"No valid products found with query: '{search_query}'")
+                
+        except TimeoutException as e:
+            logging.debug(f"Search query '{search_query}' timed out: {e}")
+            continue
+        except WebDriverException:
+            # The driver itself is broken (e.g. Chrome crashed); let the caller recycle it
+            raise
+        except Exception as e:
+            logging.debug(f"Search query '{search_query}' failed: {e}")
+            continue
+    
+    logging.warning("No products found via Selenium BJJ Fanatics search")
+    return None
 
 
-def search_bjj_fanatics_direct(search_terms: Dict[str, List[str]]) -> Optional[str]:
+def search_bjj_fanatics_direct(
+    search_terms: SearchTerms,
+    use_selenium: bool = True,
+    session: Optional[requests.Session] = None
+) -> Optional[str]:
     """Search BJJ Fanatics directly - fallback to simple requests if Selenium fails.
     
     Args:
-        search_terms: Dictionary with instructor and series terms
+        search_terms: Parsed instructor and series terms
+        use_selenium: Try the (slow to start) Selenium search before plain requests
+        session: Keep-alive session for the plain requests search (default: the calling thread's)
         
     Returns:
         BJJ Fanatics product URL if found, None otherwise
     """
     # Try Selenium first for JavaScript handling
-    if SELENIUM_AVAILABLE:
+    if use_selenium and SELENIUM_AVAILABLE:
         result = search_bjj_fanatics_selenium(search_terms)
         if result:
             return result
@@ -282,74 +515,71 @@ def search_bjj_fanatics_direct(search_terms: Dict[str, List[str]]) -> Optional[s
     # Fallback: simple requests (may not work well due to JavaScript)
     logging.debug("Selenium failed, trying simple requests fallback")
     
-    if not BS4_AVAILABLE:
-        logging.warning("BeautifulSoup not available for direct search")
+    if not HTML_PARSER_AVAILABLE:
+        logging.warning("Neither selectolax nor BeautifulSoup available for direct search")
         return None
         
     try:
-        # Build search query from terms
-        query_parts = []
-        
-        # Add instructor name
-        if search_terms['instructor']:
-            instructor_query = ' '.join(search_terms['instructor'])
-            query_parts.append(instructor_query)
-        
-        # Add series/technique terms (use more words for better matching)
-        if search_terms['series']:
-            series_query = ' '.join(search_terms['series'][:4])  # First 4 words for better context
-            query_parts.append(series_query)
-        
-        # Create search query
-        search_query = ' '.join(query_parts)
-        logging.debug(f"Fallback BJJ Fanatics search query: '{search_query}'")
+        search_url = _direct_search_url(search_terms)
         
-        search_url = f"https://bjjfanatics.com/search?q={requests.utils.quote(search_query)}"
-        
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(search_url, headers=headers, timeout=10)
+        with _BJJ_SEMAPHORE:
+            response = (session or _get_session()).get(search_url, timeout=_HTTP_TIMEOUT)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Look for product links
-        product_links = []
-        selectors = ['a[href*="/products/"]']
-        
-        for selector in selectors:
-            links = soup.select(selector)
-            for link in links:
-                href = link.get('href')
-                if href and '/products/' in href:
-                    if href.startswith('/'):
-                        href = f"https://bjjfanatics.com{href}"
-                    product_links.append(href)
-        
-        # Remove duplicates
-        product_links = list(dict.fromkeys(product_links))
-        
-        if product_links:
-            logging.debug(f"Fallback search found {len(product_links)} products")
-            first_product = product_links[0]
-            logging.debug(f"Found BJJ Fanatics product via fallback: {first_product}")
-            return first_product
-        
-        logging.warning("No products found via fallback search")
-        return None
+        return _first_product_link(response.text)
         
     except Exception as e:
         logging.error(f"Fallback BJJ Fanatics search failed: {e}")
         return None
 
 
-def search_bjj_fanatics_google(search_terms: Dict[str, List[str]]) -> Optional[str]:
+def _direct_search_url(search_terms: SearchTerms) -> str:
+    """Build the bjjfanatics.com search URL used by the requests-based searches."""
+    # Build search query from terms
+    query_parts = []
+    
+    # Add instructor name
+    if search_terms.instructor:
+        instructor_query = ' '.join(search_terms.instructor)
+        query_parts.append(instructor_query)
+    
+    # Add series/technique terms (use more words for better matching)
+    if search_terms.series:
+        series_query = ' '.join(search_terms.series[:4])  # First 4 words for better context
+        query_parts.append(series_query)
+    
+    # Create search query
+    search_query = ' '.join(query_parts)
+    logging.debug(f"Fallback BJJ Fanatics search query: '{search_query}'")
+    
+    return f"https://bjjfanatics.com/search?q={requests.utils.quote(search_query)}"
+
+
+def _first_product_link(html: str) -> Optional[str]:
+    """Return the first product link on a bjjfanatics.com search results page."""
+    # Look for product links (selectolax's C parser when available, BeautifulSoup otherwise)
+    if SELECTOLAX_AVAILABLE:
+        hrefs = (node.attributes.get('href') for node in HTMLParser(html).css('a[href*="/products/"]'))
+    else:
+        hrefs = (link.get('href') for link in BeautifulSoup(html, 'html.parser').select('a[href*="/products/"]'))
+    
+    first_product = _pick_best_product(
+        f"https://bjjfanatics.com{href}" if href.startswith('/') else href
+        for href in hrefs if href
+    )
+    if first_product:
+        logging.debug(f"Found BJJ Fanatics product via fallback: {first_product}")
+        return first_product
+    
+    logging.warning("No products found via fallback search")
+    return None
+
+
+def search_bjj_fanatics_google(search_terms: SearchTerms) -> Optional[str]:
     """Search Google for BJJ Fanatics product page.
     
     Args:
-        search_terms: Dictionary with instructor and series terms
+        search_terms: Parsed instructor and series terms
         
     Returns:
         BJJ Fanatics product URL if found, None otherwise
@@ -359,21 +589,31 @@ def search_bjj_fanatics_google(search_terms: Dict[str, List[str]]) -> Optional[s
         query_parts = []
         
         # Add instructor name with high priority
-        if search_terms['instructor']:
-            instructor_query = ' '.join(search_terms['instructor'])
+        if search_terms.instructor:
+            instructor_query = ' '.join(search_terms.instructor)
             query_parts.append(f'"{instructor_query}"')  # Use quotes for exact match
         
         # Add series/technique terms (use more words for better matching)
-        if search_terms['series']:
-            series_query = ' '.join(search_terms['series'][:4])  # First 4 words for better context
+        if search_terms.series:
+            series_query = ' '.join(search_terms.series[:4])  # First 4 words for better context
             query_parts.append(series_query)
         
         # Construct final Google query
         google_query = f"site:bjjfanatics.com {' '.join(query_parts)}"
         logging.info(f"Google search query: {google_query}")
         
-        # Perform Google search
-        search_results = list(search(google_query, num_results=5, lang="en"))
+        # Perform Google search (googlesearch uses its own requests calls, so the
+        # session hook doesn't see them; report their health here instead)
+        with _GOOGLE_SEMAPHORE:
+            started = time.perf_counter()
+            try:
+                search_results = list(search(google_query, num_results=5, lang="en"))
+            except Exception as e:
+                # A 429 surfaces as requests' HTTPError; anything else is a failed search
+                status = getattr(getattr(e, 'response', None), 'status_code', None)
+                _record_response_health(status if status in (429, 503) else None, time.perf_counter() - started)
+                raise
+            _record_response_health(200, time.perf_counter() - started)
         logging.info(f"Google search returned {len(search_results)} results")
         
         for i, url in enumerate(search_results):
@@ -398,11 +638,11 @@ def search_bjj_fanatics_google(search_terms: Dict[str, List[str]]) -> Optional[s
         return None
 
 
-def search_bjj_fanatics_duckduckgo(search_terms: Dict[str, List[str]]) -> Optional[str]:
+def search_bjj_fanatics_duckduckgo(search_terms: SearchTerms) -> Optional[str]:
     """Search DuckDuckGo for BJJ Fanatics product page.
     
     Args:
-        search_terms: Dictionary with instructor and series terms
+        search_terms: Parsed instructor and series terms
         
     Returns:
         BJJ Fanatics product URL if found, None otherwise
@@ -412,52 +652,34 @@ def search_bjj_fanatics_duckduckgo(search_terms: Dict[str, List[str]]) -> Option
         return None
         
     try:
-        # INSTRUCTOR-FOCUSED search strategies
-        search_queries = []
-        
-        # Strategy 1: Instructor only (most reliable)
-        if search_terms['instructor']:
-            instructor_query = ' '.join(search_terms['instructor'])
-            search_queries.append(f'site:bjjfanatics.com "{instructor_query}"')
-        
-        # Strategy 2: Instructor + key series terms
-        if search_terms['instructor'] and search_terms['series']:
-            instructor_query = ' '.join(search_terms['instructor'])
-            key_series = ' '.join(search_terms['series'][:2])
-            search_queries.append(f'site:bjjfanatics.com "{instructor_query}" {key_series}')
-        
-        # Try each search query
-        for ddg_query in search_queries:
-            logging.info(f"DuckDuckGo search query: {ddg_query}")
-            
-            try:
-                # Perform DuckDuckGo search
-                with DDGS() as ddgs:
+        # INSTRUCTOR-FOCUSED search strategies: instructor only, then instructor + key series terms
+        search_queries = (f'site:bjjfanatics.com {query}' for query in islice(_instructor_queries(search_terms), 2))
+        
+        # Try each search query on one DDGS client so its HTTP session is reused
+        with _DDG_SEMAPHORE, DDGS() as ddgs:
+            for ddg_query in search_queries:
+                logging.info(f"DuckDuckGo search query: {ddg_query}")
+                
+                started = time.perf_counter()
+                try:
+                    # Perform DuckDuckGo search
                     search_results = list(ddgs.text(ddg_query, max_results=5))
+                    _record_response_health(200, time.perf_counter() - started)
                     logging.info(f"DuckDuckGo search returned {len(search_results)} results")
                     
                     for i, result in enumerate(search_results):
-                        url = result.get('href', '')
-                        logging.debug(f"DuckDuckGo result {i+1}: {url}")
-                        
-                        # Filter for product pages
-                        if '/products/' in url and 'bjjfanatics.com' in url:
-                            # Skip obviously wrong results
-                            if 'atos2025' not in url and 'gift-card' not in url and 'retreat' not in url and 'insiders-club' not in url:
-                                logging.info(f"Found BJJ Fanatics product via DuckDuckGo: {url}")
-                                return url
+                        logging.debug(f"DuckDuckGo result {i+1}: {result.get('href', '')}")
                     
-                    # If no filtered product links, try the first BJJ Fanatics result
-                    bjj_results = [r.get('href', '') for r in search_results if 'bjjfanatics.com' in r.get('href', '') and '/products/' in r.get('href', '')]
-                    if bjj_results:
-                        first_result = bjj_results[0]
-                        if 'atos2025' not in first_result and 'gift-card' not in first_result and 'retreat' not in first_result:
-                            logging.info(f"Using first filtered BJJ Fanatics result: {first_result}")
-                            return first_result
-                
-            except Exception as e:
-                logging.debug(f"DuckDuckGo query '{ddg_query}' failed: {e}")
-                continue
+                    # First product page that isn't an obviously wrong (promotional) result
+                    url = _pick_best_product(result.get('href', '') for result in search_results)
+                    if url:
+                        logging.info(f"Found BJJ Fanatics product via DuckDuckGo: {url}")
+                        return url
+                    
+                except Exception as e:
+                    _record_response_health(None, time.perf_counter() - started)
+                    logging.debug(f"DuckDuckGo query '{ddg_query}' failed: {e}")
+                    continue
             
         logging.warning("No suitable BJJ Fanatics products found via DuckDuckGo")
         return None
@@ -467,6 +689,7 @@ def search_bjj_fanatics_duckduckgo(search_terms: Dict[str, List[str]]) -> Option
         return None
 
 
+@lru_cache(maxsize=4096)
 def clean_product_url(product_url: str) -> str:
     """Clean product URL by removing tracking parameters and normalizing.
     
@@ -479,61 +702,133 @@ def clean_product_url(product_url: str) -> str:
     if not product_url:
         return ""
     
-    # Remove tracking parameters (everything after ? or #)
-    clean_url = product_url.split('?')[0].split('#')[0]
-    return clean_url.lower()
+    # Plain http(s) URLs without query, fragment or whitespace already are their
+    # cleaned form, so only lowercasing is left; everything else goes through urlsplit
+    if '?' not in product_url and '#' not in product_url and ' ' not in product_url and product_url.isprintable():
+        scheme, sep, rest = product_url.partition('://')
+        if sep and scheme in ('https', 'http') and rest and rest[0] != '/':
+            return product_url.lower()
+    
+    # Remove tracking parameters (query string and fragment)
+    try:
+        parts = urlsplit(product_url)
+    except ValueError:  # e.g. malformed IPv6 netloc
+        return product_url.split('?')[0].split('#')[0].lower()
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, '', '')).lower()
+
+
+@lru_cache(maxsize=1024)
+def _instructor_pattern(instructor_lc: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile one alternation over the lowercased instructor name parts used for URL validation."""
+    parts = [part for part in instructor_lc if len(part) >= 3]
+    if not parts:
+        return None
+    return re.compile('|'.join(map(re.escape, parts)))
 
 
-def validate_product_url(product_url: str, search_terms: Dict[str, List[str]]) -> bool:
+def validate_product_url(product_url: str, search_terms: SearchTerms) -> bool:
     """Validate that the product URL contains at least part of the instructor's name.
     
     Args:
         product_url: The product page URL to validate
-        search_terms: Dictionary with instructor and series terms
+        search_terms: Parsed instructor and series terms
         
     Returns:
         True if URL is valid (contains instructor name), False otherwise
     """
-    if not product_url or not search_terms.get('instructor'):
+    if not product_url or not search_terms.instructor:
+        return False
+    
+    pattern = _instructor_pattern(search_terms.instructor_lc)
+    if pattern is None:
+        logging.debug(f"URL validation failed: no instructor name part of 3+ letters in {search_terms.instructor}")
         return False
     
     # Clean URL and convert to lowercase for case-insensitive matching
     url_lower = clean_product_url(product_url)
     
-    # Check if any part of the instructor's name appears in the URL
-    for name_part in search_terms['instructor']:
-        if len(name_part) >= 3 and name_part.lower() in url_lower:
-            logging.debug(f"URL validation passed: '{name_part}' found in {product_url}")
-            return True
-    
-    # Check for common name variations (first/last name combinations)
-    instructor_full = ' '.join(search_terms['instructor']).lower()
-    instructor_parts = [part.lower() for part in search_terms['instructor'] if len(part) >= 3]
-    
-    # Check if first and last name appear together (with hyphens)
-    if len(instructor_parts) >= 2:
-        # Try "firstname-lastname" pattern
-        name_combo = '-'.join(instructor_parts[:2])
-        if name_combo in url_lower:
-            logging.debug(f"URL validation passed: '{name_combo}' found in {product_url}")
-            return True
-        
-        # Try "lastname-firstname" pattern  
-        name_combo = '-'.join(instructor_parts[:2][::-1])
-        if name_combo in url_lower:
-            logging.debug(f"URL validation passed: '{name_combo}' found in {product_url}")
-            return True
+    # Check if any part of the instructor's name appears in the URL. This also covers
+    # "firstname-lastname" and "lastname-firstname" slugs, which contain each part.
+    match = pattern.search(url_lower)
+    if match:
+        logging.debug(f"URL validation passed: '{match.group(0)}' found in {product_url}")
+        return True
     
     logging.debug(f"URL validation failed: No instructor name found in {product_url}")
-    logging.debug(f"Expected instructor: {search_terms['instructor']}")
+    logging.debug(f"Expected instructor: {search_terms.instructor}")
     return False
 
 
-def find_product_page(filename: str) -> Optional[str]:
+def _cache_lookup(filename: str) -> Optional[str]:
+    """Return the cached product URL for a filename and refresh its access time."""
+    global _CACHE_TRIMMED
+    key = Path(filename).name
+    try:
+        with _CACHE_LOCK, shelve.open(_CACHE_PATH) as db:
+            if not _CACHE_TRIMMED:
+                _trim_cache(db)
+                _CACHE_TRIMMED = True
+            entry = db.get(key)
+            if entry is None:
+                return None
+            entry['accessed'] = time.time()
+            db[key] = entry
+            return entry['url']
+    except Exception as e:
+        logging.debug(f"Product page cache lookup failed: {e}")
+        return None
+
+
+def _cache_store(filename: str, product_url: str) -> None:
+    """Record a validated product URL for a filename."""
+    try:
+        with _CACHE_LOCK, shelve.open(_CACHE_PATH) as db:
+            db[Path(filename).name] = {'url': product_url, 'accessed': time.time()}
+    except Exception as e:
+        logging.debug(f"Product page cache write failed: {e}")
+
+
+def _trim_cache(db) -> None:
+    """Evict the least recently used entries beyond _CACHE_MAX_ENTRIES."""
+    excess = len(db) - _CACHE_MAX_ENTRIES
+    if excess <= 0:
+        return
+    by_age = sorted(db.keys(), key=lambda k: db[k]['accessed'])
+    for key in by_age[:excess]:
+        del db[key]
+    logging.debug(f"Evicted {excess} entries from product page cache")
+
+
+def find_product_page(filename: str, use_cache: bool = True, session: Optional[requests.Session] = None) -> Optional[str]:
     """Find BJJ Fanatics product page for a video filename.
     
     Args:
         filename: Video filename
+        use_cache: Check and update the on-disk filename -> URL cache
+        session: Keep-alive requests.Session for bjjfanatics.com requests (default: one
+            pooled session per calling thread, reused across calls)
+        
+    Returns:
+        Product page URL if found and validated, None otherwise
+    """
+    if use_cache:
+        cached_url = _cache_lookup(filename)
+        if cached_url:
+            logging.info(f"Using cached product page for {filename}: {cached_url}")
+            return cached_url
+    
+    product_url = _search_product_page(filename, session)
+    if product_url and use_cache:
+        _cache_store(filename, product_url)
+    return product_url
+
+
+def _search_product_page(filename: str, session: Optional[requests.Session] = None) -> Optional[str]:
+    """Run the search backends in order and return the first validated product URL.
+    
+    Args:
+        filename: Video filename
+        session: Keep-alive session for bjjfanatics.com requests (default: the calling thread's)
         
     Returns:
         Product page URL if found and validated, None otherwise
@@ -546,11 +841,13 @@ def find_product_page(filename: str) -> Optional[str]:
     
     # Try multiple search methods in order of preference
     product_url = None
+    ddg_returned_nothing = True
     
     # Method 1: DuckDuckGo search (reliable, no rate limits)
     if DUCKDUCKGO_AVAILABLE:
         logging.info("Method 1: Trying DuckDuckGo search...")
         product_url = search_bjj_fanatics_duckduckgo(search_terms)
+        ddg_returned_nothing = product_url is None
         if product_url and validate_product_url(product_url, search_terms):
             logging.info(f"Found and validated product page: {product_url}")
             return product_url
@@ -558,10 +855,12 @@ def find_product_page(filename: str) -> Optional[str]:
             logging.warning(f"Found product but validation failed, continuing search: {product_url}")
             product_url = None
     
-    # Method 2: Direct BJJ Fanatics search with Selenium (handles JavaScript)
+    # Method 2: Direct BJJ Fanatics search. Selenium (handles JavaScript) is only started
+    # when DuckDuckGo returned nothing at all; after a DuckDuckGo hit that failed
+    # validation, only the cheap requests search is tried.
     if not product_url:
         logging.info("Method 2: Trying direct BJJ Fanatics search...")
-        product_url = search_bjj_fanatics_direct(search_terms)
+        product_url = search_bjj_fanatics_direct(search_terms, use_selenium=ddg_returned_nothing, session=session)
         if product_url and validate_product_url(product_url, search_terms):
             logging.info(f"Found and validated product page: {product_url}")
             return product_url
@@ -584,6 +883,117 @@ def find_product_page(filename: str) -> Optional[str]:
     return None
 
 
+def find_product_pages(filenames: List[str], max_workers: int = 8) -> Dict[str, Optional[str]]:
+    """Find BJJ Fanatics product pages for several filenames concurrently.
+    
+    Args:
+        filenames: Video filenames to look up
+        max_workers: Maximum number of filenames searched at once
+        
+    Returns:
+        Dictionary mapping each filename to its product URL (None if not found)
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(filenames, executor.map(find_product_page, filenames)))
+
+
+async def _search_ddg_async(search_terms: SearchTerms) -> Optional[str]:
+    """Run the (synchronous) DuckDuckGo search on the backend executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BACKEND_EXECUTOR, search_bjj_fanatics_duckduckgo, search_terms)
+
+
+async def _search_google_async(search_terms: SearchTerms) -> Optional[str]:
+    """Run the (synchronous) Google search on the backend executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BACKEND_EXECUTOR, search_bjj_fanatics_google, search_terms)
+
+
+async def _search_direct_async(search_terms: SearchTerms, session) -> Optional[str]:
+    """Search bjjfanatics.com with aiohttp (plain requests on the executor without it).
+    
+    Args:
+        search_terms: Parsed instructor and series terms
+        session: aiohttp.ClientSession, or None when aiohttp is not installed
+        
+    Returns:
+        BJJ Fanatics product URL if found, None otherwise
+    """
+    if session is None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_BACKEND_EXECUTOR, search_bjj_fanatics_direct, search_terms, False)
+    
+    started = time.perf_counter()
+    try:
+        async with session.get(_direct_search_url(search_terms)) as response:
+            _record_response_health(response.status, time.perf_counter() - started)
+            response.raise_for_status()
+            html = await response.text()
+        return _first_product_link(html)
+    except Exception as e:
+        logging.error(f"Async BJJ Fanatics search failed: {e}")
+        return None
+
+
+async def find_product_page_async(filename: str, use_cache: bool = True) -> Optional[str]:
+    """Find a product page by racing DuckDuckGo, direct and Google searches.
+    
+    Unlike find_product_page, backends are queried concurrently and the first
+    validated URL wins; Selenium is not used.
+    
+    Args:
+        filename: Video filename
+        use_cache: Check and update the on-disk filename -> URL cache
+        
+    Returns:
+        Product page URL if found and validated, None otherwise
+    """
+    if use_cache:
+        cached_url = _cache_lookup(filename)
+        if cached_url:
+            logging.info(f"Using cached product page for {filename}: {cached_url}")
+            return cached_url
+    
+    logging.info(f"Processing filename: {filename}")
+    search_terms = parse_video_filename(filename)
+    logging.debug(f"Parsed search terms: {search_terms}")
+    
+    session = None
+    if AIOHTTP_AVAILABLE:
+        session = aiohttp.ClientSession(
+            headers={'User-Agent': _USER_AGENT},
+            timeout=aiohttp.ClientTimeout(sock_connect=_HTTP_TIMEOUT[0], sock_read=_HTTP_TIMEOUT[1])
+        )
+    
+    tasks = []
+    if DUCKDUCKGO_AVAILABLE:
+        tasks.append(asyncio.ensure_future(_search_ddg_async(search_terms)))
+    if HTML_PARSER_AVAILABLE:
+        tasks.append(asyncio.ensure_future(_search_direct_async(search_terms, session)))
+    if GOOGLE_AVAILABLE:
+        tasks.append(asyncio.ensure_future(_search_google_async(search_terms)))
+    
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            product_url = await next_done
+            if product_url and validate_product_url(product_url, search_terms):
+                logging.info(f"Found and validated product page: {product_url}")
+                if use_cache:
+                    _cache_store(filename, product_url)
+                return product_url
+            elif product_url:
+                logging.warning(f"Found product but validation failed, waiting for other backends: {product_url}")
+    finally:
+        # Searches running on the executor finish in the background; their results are dropped
+        for task in tasks:
+            task.cancel()
+        if session is not None:
+            await session.close()
+    
+    logging.warning(f"No valid product page found for: {filename}")
+    return None
+
+
 def get_output_file_path(video_paths: List[str]) -> Path:
     """Get the path for product-pages.txt based on video file locations.
     
@@ -593,26 +1003,22 @@ def get_output_file_path(video_paths: List[str]) -> Path:
     Returns:
         Path to product-pages.txt file
     """
+    return _output_file_path(tuple(video_paths))
+
+
+@lru_cache(maxsize=16)
+def _output_file_path(video_paths: Tuple[str, ...]) -> Path:
+    """Memoized body of get_output_file_path (called on every append)."""
     # Determine the common directory of all video files
     if len(video_paths) == 1:
         # Single file - use its directory
         video_dir = Path(video_paths[0]).parent
     else:
-        # Multiple files - try to find common parent directory
-        paths = [Path(p) for p in video_paths]
+        # Multiple files - find common parent directory
         try:
-            # Find common parent directory
-            common_parts = Path(paths[0]).parts
-            for path in paths[1:]:
-                parts = path.parts
-                common_parts = common_parts[:len([i for i, (a, b) in enumerate(zip(common_parts, parts)) if a == b])]
-            
-            if common_parts:
-                video_dir = Path(*common_parts)
-            else:
-                video_dir = Path.cwd()  # Fallback to current directory
-        except:
-            video_dir = Path.cwd()  # Fallback to current directory
+            video_dir = Path(os.path.commonpath(video_paths))
+        except ValueError:
+            video_dir = Path.cwd()  # Fallback to current directory (e.g. mixed absolute/relative paths)
     
     return video_dir / "product-pages.txt"
 
@@ -634,22 +1040,18 @@ def load_existing_results(video_paths: List[str]) -> Dict[str, str]:
         return existing_results
     
     try:
-        with open(output_file, 'r') as f:
-            lines = f.readlines()
-        
         logging.info(f"Loading existing results from {output_file}")
         
-        for line in lines:
-            line = line.strip()
-            if line and line.startswith('http'):
-                # New format: just the URL on each line
-                existing_results[line] = line
-            elif '→' in line:
-                # Legacy format: "1→https://bjjfanatics.com/products/..."
-                parts = line.split('→', 1)
-                if len(parts) == 2:
-                    url = parts[1].strip()
-                    existing_results[url] = url
+        with open(output_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith('http'):
+                    # New format: just the URL on each line
+                    existing_results.setdefault(line, line)
+                elif '→' in line:
+                    # Legacy format: "1→https://bjjfanatics.com/products/..."
+                    url = line.partition('→')[2].strip()
+                    existing_results.setdefault(url, url)
         
         logging.info(f"Loaded {len(existing_results)} existing results")
         return existing_results
@@ -659,6 +1061,60 @@ def load_existing_results(video_paths: List[str]) -> Dict[str, str]:
         return {}
 
 
+# Parsed form of each URL in product-pages.txt, kept next to it between runs. Bump the
+# schema version whenever extract_instructor_from_url or clean_product_url change output.
+_URL_CACHE_NAME = '.product-pages-cache.json'
+_URL_CACHE_SCHEMA_VERSION = 1
+
+
+def load_parsed_urls(video_paths: List[str], existing_results: Dict[str, str]) -> Dict[str, Tuple[List[str], str]]:
+    """Return the instructor names and cleaned form of each existing URL.
+    
+    Entries come from the .product-pages-cache.json sidecar when present; only URLs
+    added since the last run are parsed. The sidecar is rewritten when URLs were
+    added or removed, so it always mirrors product-pages.txt.
+    
+    Args:
+        video_paths: List of video file paths to determine output location
+        existing_results: URLs loaded by load_existing_results
+        
+    Returns:
+        Dictionary mapping each URL to (instructor names, cleaned URL)
+    """
+    cache_file = get_output_file_path(video_paths).with_name(_URL_CACHE_NAME)
+    cached = {}
+    try:
+        with open(cache_file, 'r') as f:
+            data = json.load(f)
+        if data.get('schema_version') == _URL_CACHE_SCHEMA_VERSION:
+            cached = data['urls']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.debug("Ignoring unreadable %s: %s", cache_file, e)
+    
+    parsed_urls = {}
+    new_count = 0
+    for url in existing_results:
+        entry = cached.get(url)
+        if not isinstance(entry, list) or len(entry) != 2:
+            entry = [extract_instructor_from_url(url), clean_product_url(url)]
+            new_count += 1
+        parsed_urls[url] = (entry[0], entry[1])
+    
+    if new_count or len(parsed_urls) != len(cached):
+        try:
+            tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump({'schema_version': _URL_CACHE_SCHEMA_VERSION, 'urls': parsed_urls}, f, separators=(',', ':'))
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            logging.debug("Could not write %s: %s", cache_file, e)
+    
+    logging.debug("Parsed %d new URLs (%d from %s)", new_count, len(parsed_urls) - new_count, cache_file)
+    return parsed_urls
+
+
 def extract_instructor_from_url(product_url: str) -> List[str]:
     """Extract instructor name from BJJ Fanatics product URL.
     
@@ -694,84 +1150,361 @@ def extract_instructor_from_url(product_url: str) -> List[str]:
     return instructor_parts
 
 
-def match_series_to_existing_results(series_groups: Dict[str, List[str]], existing_results: Dict[str, str]) -> Dict[str, str]:
-    """Match series to existing results using smarter URL analysis with better series matching.
+# Below this many series x URL pairs, NumPy call overhead outweighs vectorized scoring
+_NUMPY_MIN_PAIRS = 512
+
+
+class Series(NamedTuple):
+    """A video series to match, normalized once for scoring."""
+    key: str
+    instructor: Tuple[str, ...]  # Lowercased instructor words of 3+ letters (shorter ones never score)
+    words: Tuple[str, ...]       # Lowercased series words
+    instructor_set: Optional[FrozenSet[str]]  # instructor as a set; None if a word repeats
+
+
+class UrlEntry(NamedTuple):
+    """An existing product URL, normalized once for scoring."""
+    url: str
+    instructor: Tuple[str, ...]  # Lowercased instructor names of 3+ letters from the URL
+    clean_url: str
+    instructor_set: Optional[FrozenSet[str]]  # instructor as a set; None if a name repeats
+
+
+def _scoring_names(names: Iterable[str]) -> Tuple[Tuple[str, ...], Optional[FrozenSet[str]]]:
+    """Return the names that can score (3+ letters), plus them as a set or None if one repeats.
+    
+    A name shorter than 3 letters can't contain or be contained in another name
+    under the scoring rules, so it is dropped. A repeated name makes the pair counts
+    differ from set sizes, so those series/URLs are scored pairwise instead of with
+    set intersection.
+    """
+    names = tuple(name for name in names if len(name) >= 3)
+    name_set = frozenset(names)
+    return names, (name_set if len(name_set) == len(names) else None)
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _url_word_hits(words: Set[str], url_entries, trigram_index) -> List[Set[str]]:
+    """Find which of the given words occur as substrings of each cleaned URL.
+    
+    Uses one Aho-Corasick pass per URL when pyahocorasick is installed; otherwise
+    only checks URLs that contain every trigram of a word.
     
     Args:
-        series_groups: Dictionary mapping series keys to video file lists
-        existing_results: Dictionary of existing URLs
+        words: Lowercased series words (4+ letters)
+        url_entries: UrlEntry per URL
+        trigram_index: Maps trigrams to the url_entries positions containing them
         
     Returns:
-        Dictionary mapping series keys to existing URLs
+        Set of contained words for each entry of url_entries
     """
-    series_matches = {}
-    used_urls = set()  # Track which URLs have been matched
+    hits = [set() for _ in url_entries]
+    if not words:
+        return hits
+    
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for word in words:
+            automaton.add_word(word, word)
+        automaton.make_automaton()
+        for idx, entry in enumerate(url_entries):
+            hits[idx].update(word for _, word in automaton.iter(entry.clean_url))
+    else:
+        for word in words:
+            for idx in set.intersection(*(trigram_index.get(gram, set()) for gram in _trigrams(word))):
+                if word in url_entries[idx].clean_url:
+                    hits[idx].add(word)
+    return hits
+
+
+def _partial_name_matches(series_names: Iterable[str], url_names: Iterable[str]) -> Dict[str, FrozenSet[str]]:
+    """Map series names to the other URL names they contain or are contained in.
     
-    # First, extract instructor info from each existing URL
-    url_instructors = {}
-    for existing_url in existing_results.keys():
-        instructors = extract_instructor_from_url(existing_url)
-        if instructors:
-            url_instructors[existing_url] = [name.lower() for name in instructors]
-            logging.debug(f"URL {existing_url} -> instructors: {instructors}")
+    Only names of 3+ letters take part. Equal names are left out (callers count
+    those with set intersection), and so are series names without partial matches.
+    Any containing pair shares a trigram, so only those pairs are compared.
+    """
+    name_grams = defaultdict(set)
+    for url_name in url_names:
+        if len(url_name) >= 3:
+            for gram in _trigrams(url_name):
+                name_grams[gram].add(url_name)
+    
+    partial = {}
+    for series_name in series_names:
+        if len(series_name) < 3:
+            continue
+        candidates = set()
+        for gram in _trigrams(series_name):
+            candidates |= name_grams.get(gram, set())
+        related = frozenset(
+            url_name for url_name in candidates
+            if url_name != series_name and (series_name in url_name or url_name in series_name)
+        )
+        if related:
+            partial[series_name] = related
+    return partial
+
+
+def _score_matches_python(series_info, url_entries, trigram_index) -> List[Tuple[int, int, int]]:
+    """Score each series against the URLs sharing one of its trigrams.
     
-    # Create list of series with their info for better matching
-    series_info = []
-    for series_key, series_files in series_groups.items():
-        representative_file = series_files[0]
-        filename = Path(representative_file).name
-        search_terms = parse_video_filename(filename)
+    Args:
+        series_info: Series per series
+        url_entries: UrlEntry per URL
+        trigram_index: Maps trigrams to the url_entries positions containing them
         
-        if search_terms.get('instructor'):
-            series_instructor = [name.lower() for name in search_terms['instructor']]
-            series_words = [word.lower() for word in search_terms.get('series', [])]
-            series_info.append((series_key, series_instructor, series_words))
+    Returns:
+        (score, series_info position, url_entries position) for every pair with a positive score
+    """
+    word_hits = _url_word_hits(
+        {word for series in series_info for word in series.words if len(word) >= 4},
+        url_entries, trigram_index
+    )
+    
+    partial = _partial_name_matches(
+        {name for series in series_info for name in series.instructor},
+        {name for entry in url_entries for name in entry.instructor}
+    )
     
-    # Calculate match scores for all series-URL combinations
     matches = []
-    for series_key, series_instructor, series_words in series_info:
-        for existing_url, url_instructor in url_instructors.items():
-            # Calculate instructor match score
-            instructor_score = 0
-            for series_name in series_instructor:
-                for url_name in url_instructor:
-                    if len(series_name) >= 3 and series_name in url_name:
-                        instructor_score += 2  # Exact match
-                    elif len(url_name) >= 3 and url_name in series_name:
-                        instructor_score += 2  # Exact match
+    for row, (_, series_instructor, series_words, series_iset) in enumerate(series_info):
+        if series_iset is not None:
+            series_partial = [partial[name] for name in series_iset if name in partial]
+        
+        series_grams = set()
+        for token in series_instructor:
+            series_grams |= _trigrams(token)
+        for token in series_words:
+            if len(token) >= 4:
+                series_grams |= _trigrams(token)
+        candidates = set()
+        for gram in series_grams:
+            candidates |= trigram_index.get(gram, set())
+        
+        for idx in candidates:
+            _, url_instructor, _, url_iset = url_entries[idx]
+            # Calculate instructor match score: 2 per (series name, URL name) pair where one contains the other
+            if series_iset is not None and url_iset is not None:
+                instructor_score = 2 * len(series_iset & url_iset)  # Exact match
+                for related in series_partial:
+                    instructor_score += 2 * len(related & url_iset)
+            else:
+                # Names are all 3+ letters, and every matching pair earns its own credit
+                instructor_score = 0
+                for series_name in series_instructor:
+                    for url_name in url_instructor:
+                        if series_name in url_name or url_name in series_name:
+                            instructor_score += 2  # Exact match
             
             # Calculate series content match score (bonus for matching series words in URL)
             content_score = 0
-            clean_url = clean_product_url(existing_url)
+            url_words = word_hits[idx]
             for series_word in series_words:
-                if len(series_word) >= 4 and series_word in clean_url:
+                if series_word in url_words:
                     content_score += 1
             
             total_score = instructor_score + content_score
             
             if total_score > 0:  # Must have at least instructor match
-                matches.append((total_score, series_key, existing_url))
+                matches.append((total_score, row, idx))
     
-    # Sort matches by score (highest first) and assign URLs to series
-    matches.sort(reverse=True)
+    return matches
+
+
+def _score_matches_numpy(series_info, url_entries, trigram_index) -> List[Tuple[int, int, int]]:
+    """Score all series-URL pairs at once with token count matrices.
+    
+    Same scores as _score_matches_python. Series and URLs become rows of token
+    count matrices, string tests only run between distinct tokens, and the
+    scores for every pair come out of two matrix products:
+    2 * (series instructors @ name relation @ URL instructors.T) + series words @ word hits.T
+    
+    Args:
+        series_info: Series per series
+        url_entries: UrlEntry per URL
+        trigram_index: Maps trigrams to the url_entries positions containing them
+        
+    Returns:
+        (score, series_info position, url_entries position) for every pair with a positive score
+    """
+    # Only instructor tokens of 3+ letters (all that Series/UrlEntry keep) and series
+    # words of 4+ letters can score
+    series_names, url_names, words = {}, {}, {}
+    si_rows, si_cols, sw_rows, sw_cols, ui_rows, ui_cols = [], [], [], [], [], []
+    for row, series in enumerate(series_info):
+        for token in series.instructor:
+            si_rows.append(row)
+            si_cols.append(series_names.setdefault(token, len(series_names)))
+        for token in series.words:
+            if len(token) >= 4:
+                sw_rows.append(row)
+                sw_cols.append(words.setdefault(token, len(words)))
+    for row, entry in enumerate(url_entries):
+        for token in entry.instructor:
+            ui_rows.append(row)
+            ui_cols.append(url_names.setdefault(token, len(url_names)))
+    
+    # float32 keeps the products on BLAS; the counts are small integers, so they stay exact
+    series_instr = np.zeros((len(series_info), len(series_names)), dtype=np.float32)
+    np.add.at(series_instr, (si_rows, si_cols), 1)
+    series_words_m = np.zeros((len(series_info), len(words)), dtype=np.float32)
+    np.add.at(series_words_m, (sw_rows, sw_cols), 1)
+    url_instr = np.zeros((len(url_entries), len(url_names)), dtype=np.float32)
+    np.add.at(url_instr, (ui_rows, ui_cols), 1)
+    
+    # Name relation: a series name and a URL name match if they are equal or either contains the other
+    relation = np.zeros((len(series_names), len(url_names)), dtype=np.float32)
+    partial = _partial_name_matches(series_names, url_names)
+    for series_name, row in series_names.items():
+        if series_name in url_names:
+            relation[row, url_names[series_name]] = 1
+        for url_name in partial.get(series_name, ()):
+            relation[row, url_names[url_name]] = 1
+    
+    # Word hits: which series words each cleaned URL contains
+    word_hits = np.zeros((len(url_entries), len(words)), dtype=np.float32)
+    for idx, url_words in enumerate(_url_word_hits(set(words), url_entries, trigram_index)):
+        for word in url_words:
+            word_hits[idx, words[word]] = 1
+    
+    scores = 2 * (series_instr @ relation @ url_instr.T) + series_words_m @ word_hits.T
+    
+    rows, cols = np.nonzero(scores > 0.5)
+    values = np.rint(scores[rows, cols]).astype(np.int64)
+    return list(zip(values.tolist(), rows.tolist(), cols.tolist()))
+
+
+def match_series_to_existing_results(
+    series_groups: Dict[str, List[str]],
+    existing_results: Dict[str, str],
+    parsed_urls: Optional[Dict[str, Tuple[List[str], str]]] = None
+) -> Dict[str, str]:
+    """Match series to existing results using smarter URL analysis with better series matching.
+    
+    Args:
+        series_groups: Dictionary mapping series keys to video file lists
+        existing_results: Dictionary of existing URLs
+        parsed_urls: (instructor names, cleaned URL) per URL from load_parsed_urls;
+            URLs missing from it are parsed here
+        
+    Returns:
+        Dictionary mapping series keys to existing URLs
+    """
+    series_matches = {}
     
-    for score, series_key, existing_url in matches:
-        # Skip if this URL is already used or this series is already matched
-        if existing_url in used_urls or series_key in series_matches:
+    # Create list of series with their info for better matching; every string is
+    # normalized here once and the scorers only read the prepared fields
+    series_info = []
+    for series_key, series_files in series_groups.items():
+        representative_file = series_files[0]
+        search_terms = parse_video_filename(os.path.basename(representative_file))
+        
+        if search_terms.instructor:
+            series_instructor, series_iset = _scoring_names(search_terms.instructor_lc)
+            series_info.append(Series(series_key, series_instructor, search_terms.series_lc, series_iset))
+    
+    # Extract instructor info from each existing URL and index the URLs by the 3-letter
+    # substrings of their cleaned form and instructor names. Every score below comes from
+    # a 3+ letter token being a substring of one of those, so a series can only score
+    # against URLs that share at least one of its trigrams.
+    url_entries = []
+    trigram_index = defaultdict(set)
+    parsed_urls = parsed_urls or {}
+    for existing_url in existing_results.keys():
+        parsed = parsed_urls.get(existing_url)
+        if parsed is None:
+            instructors = extract_instructor_from_url(existing_url)
+            clean_url = clean_product_url(existing_url)
+        else:
+            instructors, clean_url = parsed
+        if not instructors:
             continue
-            
+        logging.debug("URL %s -> instructors: %s", existing_url, instructors)
+        url_instructor, url_iset = _scoring_names(name.lower() for name in instructors)
+        idx = len(url_entries)
+        url_entries.append(UrlEntry(existing_url, url_instructor, clean_url, url_iset))
+        for gram in _trigrams(clean_url).union(*map(_trigrams, url_instructor)):
+            trigram_index[gram].add(idx)
+    
+    # Calculate match scores for the series-URL combinations that can score
+    if NUMPY_AVAILABLE and len(series_info) * len(url_entries) >= _NUMPY_MIN_PAIRS:
+        matches = _score_matches_numpy(series_info, url_entries, trigram_index)
+    else:
+        matches = _score_matches_python(series_info, url_entries, trigram_index)
+    
+    # Number series and URLs by their sorted order, so comparing ids breaks score ties
+    # exactly like comparing (series_key, url) strings would
+    series_by_id = sorted(range(len(series_info)), key=lambda row: series_info[row].key)
+    series_ids = [0] * len(series_info)
+    for series_id, row in enumerate(series_by_id):
+        series_ids[row] = series_id
+    urls_by_id = sorted(range(len(url_entries)), key=lambda idx: url_entries[idx].url)
+    url_ids = [0] * len(url_entries)
+    for url_id, idx in enumerate(urls_by_id):
+        url_ids[idx] = url_id
+    
+    # Bucket matches by their small integer score and assign URLs to series, highest
+    # score first; only the buckets reached before every series is placed get sorted
+    buckets = defaultdict(list)
+    for score, row, idx in matches:
+        buckets[score].append((series_ids[row], url_ids[idx]))
+    
+    # One flag per series/URL id marks it as taken; stop as soon as every series or
+    # every URL has been assigned
+    used_series = bytearray(len(series_info))
+    used_urls = bytearray(len(url_entries))
+    assigned = []
+    target = min(len(series_info), len(url_entries))
+    for score in sorted(buckets, reverse=True):
+        if len(assigned) >= target:
+            break
+        for series_id, url_id in sorted(buckets[score], reverse=True):
+            # Skip if this URL is already used or this series is already matched
+            if used_urls[url_id] or used_series[series_id]:
+                continue
+                
+            used_series[series_id] = 1
+            used_urls[url_id] = 1
+            assigned.append((score, series_id, url_id))
+            if len(assigned) >= target:
+                break
+    
+    for score, series_id, url_id in assigned:
+        series_key = series_info[series_by_id[series_id]].key
+        existing_url = url_entries[urls_by_id[url_id]].url
         series_matches[series_key] = existing_url
-        used_urls.add(existing_url)
-        logging.info(f"Series '{series_key}' matches existing result: {existing_url} (score: {score})")
+        logging.info("Series '%s' matches existing result: %s (score: %d)", series_key, existing_url, score)
     
     # Log series that couldn't be matched
-    for series_key, _, _ in series_info:
-        if series_key not in series_matches:
-            logging.debug(f"No good match found for series '{series_key}'")
+    for series in series_info:
+        if series.key not in series_matches:
+            logging.debug("No good match found for series '%s'", series.key)
     
     return series_matches
 
 
+# Append handle for product-pages.txt, opened on the first append
+_output_fh = None
+_OUTPUT_LOCK = threading.Lock()
+
+
+def _close_output_file() -> None:
+    """Close the product-pages.txt append handle if it is open."""
+    global _output_fh
+    with _OUTPUT_LOCK:
+        if _output_fh is not None:
+            _output_fh.close()
+            _output_fh = None
+
+
+atexit.register(_close_output_file)
+
+
 def append_to_product_pages_file(video_paths: List[str], new_url: str) -> None:
     """Append a new product URL to product-pages.txt immediately.
     
@@ -779,17 +1512,24 @@ def append_to_product_pages_file(video_paths: List[str], new_url: str) -> None:
         video_paths: List of video file paths to determine output location
         new_url: New product URL to append
     """
+    global _output_fh
     output_file = get_output_file_path(video_paths)
     
     try:
-        # Append the new URL directly (no numbering)
-        with open(output_file, 'a') as f:
-            f.write(f"{new_url}\n")
+        with _OUTPUT_LOCK:
+            # Keep one line-buffered handle open for the run; every line is flushed as it is written
+            if _output_fh is None or _output_fh.name != str(output_file):
+                if _output_fh is not None:
+                    _output_fh.close()
+                _output_fh = open(output_file, 'a', buffering=1)
+            
+            # Append the new URL directly (no numbering)
+            _output_fh.write(f"{new_url}\n")
         
-        logging.info(f"Appended result to {output_file}: {new_url}")
+        logging.info("Appended result to %s: %s", output_file, new_url)
         
     except Exception as e:
-        logging.error(f"Failed to append to product-pages.txt: {e}")
+        logging.error("Failed to append to product-pages.txt: %s", e)
         print(f"Error appending to product-pages.txt: {e}")
 
 
@@ -809,14 +1549,36 @@ def write_product_pages_file(video_paths: List[str], results: Dict[str, Optional
                     # Write just the URL (no numbering or filename)
                     f.write(f"{url}\n")
         
-        logging.info(f"Product pages written to: {output_file}")
+        logging.info("Product pages written to: %s", output_file)
         print(f"Product pages written to: {output_file}")
         
     except Exception as e:
-        logging.error(f"Failed to write product-pages.txt: {e}")
+        logging.error("Failed to write product-pages.txt: %s", e)
         print(f"Error writing product-pages.txt: {e}")
 
 
+_VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm'})
+
+
+def _walk_video_files(root: str) -> Iterator[str]:
+    """Yield video file paths under root, walking directories with os.scandir.
+    
+    Like Path.rglob, symlinked directories are not descended into while
+    symlinked files are still reported.
+    """
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in _VIDEO_EXTENSIONS and entry.is_file():
+                        yield entry.path
+        except OSError as e:
+            logging.warning("Cannot read directory: %s", e)
+
+
 def find_video_files(paths: List[str]) -> List[str]:
     """Find all video files from the given paths (files or directories), including subdirectories.
     
@@ -826,7 +1588,6 @@ def find_video_files(paths: List[str]) -> List[str]:
     Returns:
         List of video file paths
     """
-    video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm'}
     video_files = []
     
     for path_str in paths:
@@ -834,17 +1595,20 @@ def find_video_files(paths: List[str]) -> List[str]:
         
         if path.is_file():
             # Single file - add if it's a video
-            if path.suffix.lower() in video_extensions:
+            if path.suffix.lower() in _VIDEO_EXTENSIONS:
                 video_files.append(str(path))
         elif path.is_dir():
             # Directory - find all video files recursively
-            logging.info(f"Searching directory recursively: {path}")
-            for video_file in path.rglob('*'):
-                if video_file.is_file() and video_file.suffix.lower() in video_extensions:
-                    video_files.append(str(video_file))
-                    logging.debug(f"Found video file: {video_file}")
+            logging.info("Searching directory recursively: %s", path)
+            # Checked once per directory instead of building a record for every file
+            if logging.getLogger().isEnabledFor(logging.DEBUG):
+                for video_file in _walk_video_files(str(path)):
+                    video_files.append(video_file)
+                    logging.debug("Found video file: %s", video_file)
+            else:
+                video_files.extend(_walk_video_files(str(path)))
         else:
-            logging.warning(f"Path not found: {path}")
+            logging.warning("Path not found: %s", path)
     
     return sorted(video_files)
 
@@ -861,23 +1625,31 @@ def group_videos_by_series(video_files: List[str]) -> Dict[str, List[str]]:
     series_groups = {}
     
     for filepath in video_files:
-        filename = Path(filepath).name
-        search_terms = parse_video_filename(filename)
+        search_terms = parse_video_filename(os.path.basename(filepath))
         
-        # Create series key from instructor + series (ignore episode numbers)
-        instructor_key = ' '.join(search_terms['instructor']).lower()
-        series_key = ' '.join(search_terms['series']).lower()
+        # Create series key from instructor + series (ignore episode numbers);
+        # the words are already lowercased by parse_video_filename
+        instructor_key = ' '.join(search_terms.instructor_lc)
+        series_key = ' '.join(search_terms.series_lc)
         
         # Combine instructor and series for unique key
         full_series_key = f"{instructor_key}|{series_key}"
         
-        if full_series_key not in series_groups:
-            series_groups[full_series_key] = []
-        series_groups[full_series_key].append(filepath)
+        series_groups.setdefault(full_series_key, []).append(filepath)
     
     return series_groups
 
 
+def _is_searchable(series_key: str) -> bool:
+    """Check whether a series key from group_videos_by_series can produce a validated result.
+    
+    validate_product_url rejects every URL unless an instructor word has 3+ letters,
+    so series without one would only burn searches and delays on guaranteed misses.
+    """
+    instructor_key = series_key.partition('|')[0]
+    return any(len(word) >= 3 for word in instructor_key.split())
+
+
 def main():
     """Main function with CLI interface."""
     import argparse
@@ -900,6 +1672,17 @@ def main():
         action='store_true', 
         help='Ignore existing results and search all series again'
     )
+    parser.add_argument(
+        '--race-backends',
+        action='store_true',
+        help='Query all search backends concurrently and use the first validated result (no Selenium)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Number of series searched in parallel (default: 4, use 1 for one at a time)'
+    )
     
     args = parser.parse_args()
     
@@ -925,75 +1708,106 @@ def main():
     if not args.force_refresh:
         existing_results = load_existing_results(video_files)
         if existing_results:
-            series_matches = match_series_to_existing_results(series_groups, existing_results)
+            parsed_urls = load_parsed_urls(video_files, existing_results)
+            series_matches = match_series_to_existing_results(series_groups, existing_results, parsed_urls)
             print(f"Found {len(series_matches)} series already cached in product-pages.txt")
     
     # Determine which series need to be searched
     series_to_search = {k: v for k, v in series_groups.items() if k not in series_matches}
     
+    # Series whose filenames give no usable instructor name can never validate, so skip them
+    unsearchable = [k for k in series_to_search if not _is_searchable(k)]
+    for series_key in unsearchable:
+        del series_to_search[series_key]
+        logging.info("skipped-unsearchable: no instructor name of 3+ letters in series '%s'", series_key)
+    if unsearchable:
+        print(f"Skipping {len(unsearchable)} series without a usable instructor name")
+    
     if not series_to_search:
         print("All series already have results! Use --force-refresh to search again.")
-        # Still show the cached results
-        results = {}
-        for series_key, series_files in series_groups.items():
-            cached_url = series_matches.get(series_key)
-            for filepath in series_files:
-                results[filepath] = cached_url
-                if cached_url:
-                    print(f"  {Path(filepath).name} -> {cached_url} (cached)")
-                else:
-                    print(f"  {Path(filepath).name} -> NOT FOUND")
     else:
         print(f"Need to search {len(series_to_search)} new series")
-        
-        # Process series that need searching
-        results = {}
-        series_results = {}
-        
-        # First, apply cached results
-        for series_key, cached_url in series_matches.items():
-            series_results[series_key] = cached_url
-            for filepath in series_groups[series_key]:
+    
+    # Apply cached results in one pass; every video starts out unmatched
+    results = dict.fromkeys(video_files)
+    for series_key, series_files in series_groups.items():
+        if series_key in series_to_search:
+            continue
+        cached_url = series_matches.get(series_key)
+        for filepath in series_files:
+            if cached_url:
                 results[filepath] = cached_url
-                if cached_url:
-                    print(f"  {Path(filepath).name} -> {cached_url} (cached)")
+                print(f"  {Path(filepath).name} -> {cached_url} (cached)")
+            else:
+                print(f"  {Path(filepath).name} -> NOT FOUND (skipped)")
+    
+    if series_to_search:
+        # Then search for new series, several at a time
+        output_lock = threading.Lock()  # Guards results, printing and product-pages.txt
+        progress = {'started': 0, 'completed': 0, 'last_start': None}
+        total = len(series_to_search)
         
-        # Then search for new series
-        for i, (series_key, series_files) in enumerate(series_to_search.items()):
+        def search_series(series_key, series_files):
             # Use the first file in the series for searching
             representative_file = series_files[0]
             filename = Path(representative_file).name
             
-            print(f"Processing series {i+1}/{len(series_to_search)}: {filename} (represents {len(series_files)} videos)")
+            # Series searches start one politeness delay apart across all workers, so
+            # --workers overlaps slow searches without multiplying the request rate
+            with output_lock:
+                now = time.monotonic()
+                start = now
+                if progress['last_start'] is not None:
+                    start = max(now, progress['last_start'] + _next_search_delay())
+                progress['last_start'] = start
+                wait = start - now
+                if wait > 0:
+                    print(f"Waiting {wait:.1f} seconds before next series... ({progress['completed']}/{total} series completed)")
             
-            product_url = find_product_page(filename)
-            series_results[series_key] = product_url
+            if wait > 0:
+                time.sleep(wait)
             
-            # Apply the result to all videos in this series
-            for filepath in series_files:
-                results[filepath] = product_url
-                if product_url:
-                    print(f"  {Path(filepath).name} -> {product_url}")
-                else:
-                    print(f"  {Path(filepath).name} -> NOT FOUND")
+            with output_lock:
+                progress['started'] += 1
+                print(f"Processing series {progress['started']}/{total}: {filename} (represents {len(series_files)} videos)")
             
-            # Append result immediately to file (crash protection)
-            if product_url:
-                append_to_product_pages_file(video_files, product_url)
-                print(f"  ✓ Saved to product-pages.txt")
+            if args.race_backends:
+                product_url = asyncio.run(find_product_page_async(filename, use_cache=not args.force_refresh))
+            else:
+                product_url = find_product_page(filename, use_cache=not args.force_refresh)
             
-            # Add delay between series searches (except for last item)
-            if i < len(series_to_search) - 1:
-                delay = random.uniform(10, 15)  # Random delay between 10-15 seconds
-                print(f"Waiting {delay:.1f} seconds before next series... ({i+1}/{len(series_to_search)} series completed)")
-                time.sleep(delay)
-    
-    # Final summary
-    found_count = sum(1 for url in results.values() if url)
+            with output_lock:
+                progress['completed'] += 1
+                
+                # Apply the result to all videos in this series
+                for filepath in series_files:
+                    results[filepath] = product_url
+                    if product_url:
+                        print(f"  {Path(filepath).name} -> {product_url}")
+                    else:
+                        print(f"  {Path(filepath).name} -> NOT FOUND")
+                
+                # Append result immediately to file (crash protection)
+                if product_url:
+                    append_to_product_pages_file(video_files, product_url)
+                    print(f"  ✓ Saved to product-pages.txt")
+        
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+            futures = [executor.submit(search_series, k, v) for k, v in series_to_search.items()]
+            for future in futures:
+                future.result()
+    
+    # Final summary, counted in one pass (every video in a series shares its result);
+    # a path given twice (its directory plus the file itself) is one entry in results
+    found_count = series_found = cached_count = 0
+    for series_key, series_files in series_groups.items():
+        if results[series_files[0]]:
+            series_found += 1
+            found_count += len(set(series_files))
+            if series_key in series_matches:
+                cached_count += 1
     total_count = len(results)
-    series_found = sum(1 for series_key in series_groups.keys() if series_key in series_matches or (series_key in series_to_search and results.get(series_groups[series_key][0])))
     total_series = len(series_groups)
-    cached_count = len(series_matches)
     new_count = series_found - cached_count
     
     print(f"\nSummary: {series_found}/{total_series} series found ({cached_count} cached, {new_count} new), {found_count}/{total_count} total videos matched")